@@ -260,6 +260,31 @@ class ClaudeFlowBridge:
             args.extend(["--tags", tags])
         return self._run(*args)
 
+    def store_memory_batch(
+        self,
+        texts: list[str],
+        *,
+        namespace: str = "knowledge",
+        metadata: Optional[dict] = None,
+    ) -> list[dict[str, Any]]:
+        """Store several entries in the HNSW vector memory.
+
+        The CLI has no bulk store command, so entries are stored one by one
+        with shared *namespace* and *metadata*.
+
+        Args:
+            texts: Values/contents to store.
+            namespace: Memory namespace (default 'knowledge').
+            metadata: Optional metadata dict applied to every entry.
+
+        Returns:
+            List of result dicts, one per stored entry.
+        """
+        return [
+            self.store_memory(text, namespace=namespace, metadata=metadata)
+            for text in texts
+        ]
+
     # ------------------------------------------------------------------
     # Security
     # ------------------------------------------------------------------
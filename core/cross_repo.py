@@ -7,6 +7,7 @@ Local JSON is always maintained for permission tracking.
 import json
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -259,12 +260,19 @@ def search_all_linked(
     repos = _load_linked_repos(repos_file)
     results: list[dict] = []
 
-    # Try HNSW search
+    # Try HNSW search, querying every repo's namespace concurrently
     try:
         bridge = _get_bridge()
-        for repo in repos:
-            namespace = f"linked-{repo.name}"
-            cf_result = bridge.query_memory(query, top_k=top_k, namespace=namespace)
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(repos)))) as pool:
+            cf_results = list(
+                pool.map(
+                    lambda repo: bridge.query_memory(
+                        query, top_k=top_k, namespace=f"linked-{repo.name}"
+                    ),
+                    repos,
+                )
+            )
+        for repo, cf_result in zip(repos, cf_results):
             for hit in cf_result.get("results", []):
                 results.append(
                     {
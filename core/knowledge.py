@@ -3,22 +3,55 @@
 Handles persistent knowledge across sessions: learnings, decisions,
 successful/failed approaches. When claude-flow is available, search_knowledge
 uses HNSW vector memory for semantic search, and append_learning dual-writes
-to both markdown and the vector index.
+to both markdown and the vector index (the vector write is batched on a
+background thread; call flush_hnsw_queue() to wait for it).
 
 Section matching is fuzzy and case-insensitive: aliases like "tips" resolve to
 "Tricks", "failures" resolves to "What Doesn't Work", etc.  If a section
 doesn't exist in the file it is created dynamically at the end.
 """
 
+import atexit
+import bisect
+import contextlib
+import functools
+import io
+import itertools
 import json
 import logging
+import os
+import queue
 import re
+import shutil
+import stat
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import IO, Iterable, Iterator, Optional
 
 from core.claude_flow import ClaudeFlowUnavailable, _get_bridge
 
+# Optional integrations, imported once rather than on every call; failures
+# raised while *calling* them are handled at the call sites
+try:
+    from core.collaboration import get_user_id as _get_user_id
+except ImportError:
+    _get_user_id = None
+
+try:
+    from core.cross_repo import search_all_linked as _search_all_linked
+except ImportError:
+    _search_all_linked = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 ENCYCLOPEDIA_PATH = Path("knowledge/ENCYCLOPEDIA.md")
@@ -75,12 +108,45 @@ SECTION_TYPES: dict[str, tuple[str, set[str]]] = {
 }
 
 
+_WS_RE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=256)
 def _normalize(name: str) -> str:
     """Lowercase, strip, collapse whitespace, remove trailing punctuation."""
-    name = name.strip().lower()
-    name = re.sub(r"\s+", " ", name)
-    name = name.rstrip(":")
-    return name
+    return _WS_RE.sub(" ", name.strip().lower()).rstrip(":")
+
+
+# Normalized canonical name or alias -> section-type key, built once at import
+_ALIAS_TO_KEY: dict[str, str] = {}
+for _key, (_canon, _aliases) in SECTION_TYPES.items():
+    for _alias in _aliases:
+        _ALIAS_TO_KEY.setdefault(_alias, _key)
+    _ALIAS_TO_KEY.setdefault(_normalize(_canon), _key)
+del _key, _canon, _aliases, _alias
+
+# (alias, key) pairs in SECTION_TYPES order, for the containment fallback
+_ALIAS_LIST: list[tuple[str, str]] = [
+    (_alias, _key)
+    for _key, (_canon, _aliases) in SECTION_TYPES.items()
+    for _alias in _aliases
+]
+
+
+# Section-type key -> every accepted normalized name (canonical + aliases)
+_TYPE_NAMES: dict[str, frozenset[str]] = {
+    key: frozenset(aliases | {_normalize(canon)})
+    for key, (canon, aliases) in SECTION_TYPES.items()
+}
+
+# Section-type key -> one compiled alternation of its aliases, used to test
+# "some alias occurs in this header" in a single scan
+_ALIAS_CONTAINS_RE: dict[str, re.Pattern[str]] = {
+    key: re.compile(
+        "|".join(re.escape(alias) for alias in sorted(aliases, key=len, reverse=True))
+    )
+    for key, (_canon, aliases) in SECTION_TYPES.items()
+}
 
 
 def _resolve_section_type(name: str) -> str | None:
@@ -92,14 +158,13 @@ def _resolve_section_type(name: str) -> str | None:
     """
     norm = _normalize(name)
     # 1. Exact alias hit
-    for key, (_canon, aliases) in SECTION_TYPES.items():
-        if norm in aliases or norm == _normalize(_canon):
-            return key
+    key = _ALIAS_TO_KEY.get(norm)
+    if key is not None:
+        return key
     # 2. Fuzzy containment
-    for key, (_canon, aliases) in SECTION_TYPES.items():
-        for alias in aliases:
-            if alias in norm or norm in alias:
-                return key
+    for alias, key in _ALIAS_LIST:
+        if alias in norm or norm in alias:
+            return key
     return None
 
 
@@ -131,17 +196,18 @@ def find_section(content: str, section_type: str) -> str | None:
     type_key = _resolve_section_type(section_type)
 
     if type_key is not None:
-        _canon, aliases = SECTION_TYPES[type_key]
+        aliases = SECTION_TYPES[type_key][1]
+        names = _TYPE_NAMES[type_key]
+        contains_alias = _ALIAS_CONTAINS_RE[type_key].search
         # Check discovered headers against the canonical name + aliases
         for norm_header, orig_header in discovered.items():
-            if norm_header == _normalize(_canon):
-                return orig_header
-            if norm_header in aliases:
+            if norm_header in names:
                 return orig_header
             # Also try containment for drifted names
-            for alias in aliases:
-                if alias in norm_header or norm_header in alias:
-                    return orig_header
+            if contains_alias(norm_header) or any(
+                norm_header in alias for alias in aliases
+            ):
+                return orig_header
 
     # Fallback: try direct normalized match against discovered headers
     norm_requested = _normalize(section_type)
@@ -162,6 +228,13 @@ def _default_comment_for_type(type_key: str) -> str:
     return comments.get(type_key, "")
 
 
+# Canonical section type -> the block appended when that section is missing
+_SECTION_TEMPLATE: dict[str, str] = {
+    key: f"\n\n## {canon}\n{_default_comment_for_type(key)}\n"
+    for key, (canon, _aliases) in SECTION_TYPES.items()
+}
+
+
 def _ensure_section(content: str, section_type: str) -> tuple[str, str]:
     """Ensure *content* contains a header matching *section_type*.
 
@@ -176,20 +249,331 @@ def _ensure_section(content: str, section_type: str) -> tuple[str, str]:
     type_key = _resolve_section_type(section_type)
     if type_key is not None:
         canon_name = SECTION_TYPES[type_key][0]
-        comment = _default_comment_for_type(type_key)
+        new_section = _SECTION_TEMPLATE[type_key]
     else:
         # Completely unknown section -- use the provided name capitalised
         canon_name = section_type.strip().title()
-        comment = ""
+        new_section = f"\n\n## {canon_name}\n"
 
-    new_section = f"\n\n## {canon_name}\n"
-    if comment:
-        new_section += f"{comment}\n"
     content = content.rstrip("\n") + new_section
     logger.info("Created missing section '%s' in encyclopedia", canon_name)
     return content, canon_name
 
 
+def _loads_json(raw: bytes) -> dict:
+    """Parse JSON *raw* bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@contextlib.contextmanager
+def _atomic_open(path: Path, mode: str = "w", **kwargs) -> Iterator[IO]:
+    """Open a temp file next to *path* that replaces *path* once closed.
+
+    Data goes to the temp file, which is fsynced and moved over *path* via
+    ``os.replace`` when the block exits cleanly, so readers never observe a
+    partially written file and an error or crash mid-write leaves the
+    previous version intact.
+    """
+    with tempfile.NamedTemporaryFile(
+        mode,
+        dir=path.parent,
+        prefix=f".{path.name}.",
+        suffix=".tmp",
+        delete=False,
+        **kwargs,
+    ) as tmp:
+        try:
+            yield tmp
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    _replace_from_temp(tmp.name, path)
+
+
+def _atomic_write(path: Path, *chunks: str | bytes) -> None:
+    """Write *chunks* (all ``str`` or all ``bytes``) to *path* atomically.
+
+    See :func:`_atomic_open`.  Passing pieces as separate chunks avoids
+    building one concatenated copy in memory.
+    """
+    with _atomic_open(
+        path, "wb" if chunks and isinstance(chunks[0], bytes) else "w"
+    ) as tmp:
+        for chunk in chunks:
+            tmp.write(chunk)
+
+
+def _atomic_dump_json(path: Path, data: dict) -> None:
+    """Write *data* to *path* atomically as indented JSON.
+
+    orjson serializes straight to bytes when it is installed; otherwise
+    ``json.dump`` streams into the temp file instead of building the whole
+    document as one string first.
+    """
+    if orjson is not None:
+        _atomic_write(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with _atomic_open(path, "w", buffering=1 << 20) as tmp:
+        json.dump(data, tmp, indent=2)
+
+
+def _atomic_copy(src: Path, dest: Path) -> None:
+    """Copy *src* over *dest* atomically, without decoding the content.
+
+    ``shutil.copyfile`` lets the kernel move the bytes (``sendfile`` on
+    Linux) into a temp file that then replaces *dest*.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=dest.parent, prefix=f".{dest.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp_name)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    _replace_from_temp(tmp_name, dest)
+
+
+def _replace_from_temp(tmp_name: str, path: Path) -> None:
+    """Move temp file *tmp_name* over *path*, keeping *path*'s permissions."""
+    try:
+        # Temp files are created 0600; keep the original permissions
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+_NEWLINE_RE = re.compile("\n")
+# Line boundaries recognised by str.splitlines() besides "\n"
+_OTHER_LINEBREAK_RE = re.compile("[\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+@dataclass
+class _CachedText:
+    """Decoded file content, tagged with the stat data it was read under."""
+
+    stamp: tuple[int, int, int]  # (st_ino, st_mtime_ns, st_size)
+    content: str
+
+    @functools.cached_property
+    def lowered(self) -> str:
+        """Lowercased content, computed on first keyword search."""
+        return self.content.lower()
+
+    @functools.cached_property
+    def line_starts(self) -> list[int]:
+        """Offset of the first character of every line in ``content``."""
+        return [0, *(m.end() for m in _NEWLINE_RE.finditer(self.content))]
+
+    @functools.cached_property
+    def offsets_match_lines(self) -> bool:
+        """Whether ``line_starts`` offsets are valid in ``lowered`` too.
+
+        False when lowering changes the text length or when the content has
+        line breaks other than ``"\\n"`` that ``str.splitlines()`` would honour.
+        """
+        return len(self.lowered) == len(self.content) and not (
+            _OTHER_LINEBREAK_RE.search(self.content)
+        )
+
+
+# Resolved path -> last content read, reused while the file is unchanged
+_TEXT_CACHE: dict[Path, _CachedText] = {}
+_TEXT_CACHE_MAX = 32
+
+
+def _load(path: Path) -> _CachedText:
+    """Return the content of *path*, re-reading only if the file changed.
+
+    Raises:
+        FileNotFoundError: If *path* does not exist.
+    """
+    key = path.resolve()
+    st = path.stat()
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    cached = _TEXT_CACHE.get(key)
+    if cached is None or cached.stamp != stamp:
+        if cached is None and len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.pop(next(iter(_TEXT_CACHE)))  # evict the oldest entry
+        cached = _CachedText(stamp, path.read_text())
+        _TEXT_CACHE[key] = cached
+    return cached
+
+
+def _load_or_none(path: Path) -> _CachedText | None:
+    """Like :func:`_load`, but return None if *path* does not exist.
+
+    Asking for forgiveness saves the separate ``exists()`` stat on every read
+    and cannot race with the file being removed in between.
+    """
+    try:
+        return _load(path)
+    except FileNotFoundError:
+        return None
+
+
+def _load_or_create(encyclopedia_path: Path) -> str:
+    """Return the encyclopedia content, creating a default file if missing."""
+    cached = _load_or_none(encyclopedia_path)
+    if cached is None:
+        encyclopedia_path.parent.mkdir(parents=True, exist_ok=True)
+        encyclopedia_path.write_text(
+            "# Encyclopedia\n\n## Tricks\n\n## Decisions\n\n"
+            "## What Works\n\n## What Fails\n"
+        )
+        logger.info("Created encyclopedia at %s", encyclopedia_path)
+        cached = _load(encyclopedia_path)
+    return cached.content
+
+
+# (epoch minute, formatted timestamp) of the last entry written
+_TS_CACHE: tuple[int, str] = (-1, "")
+
+
+def _minute_timestamp() -> str:
+    """Return the current ``%Y-%m-%d %H:%M`` stamp, reformatting once per minute."""
+    global _TS_CACHE
+    minute = int(time.time()) // 60
+    if minute != _TS_CACHE[0]:
+        _TS_CACHE = (minute, datetime.now().strftime("%Y-%m-%d %H:%M"))
+    return _TS_CACHE[1]
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_user_id() -> str | None:
+    """Return the collaboration user id, resolved once per process.
+
+    ``get_user_id`` shells out to git, so it is not repeated for every entry.
+    Call ``_cached_user_id.cache_clear()`` if the identity may have changed.
+    """
+    if _get_user_id is None:
+        return None
+    try:
+        return _get_user_id()
+    except Exception:
+        return None
+
+
+def _format_entries(entries: list[str], timestamp: str) -> str:
+    """Format *entries* as timestamped bullets, tagged with the user id if known."""
+    # Include user_id for collaborative tracking
+    user_id = _cached_user_id()
+    prefix = f"\n- [{timestamp}] ({user_id}) " if user_id else f"\n- [{timestamp}] "
+    return "".join(prefix + entry for entry in entries)
+
+
+@functools.lru_cache(maxsize=64)
+def _section_pattern(header: str) -> re.Pattern[str]:
+    """Compiled pattern for ``## <header>`` plus its optional comment line."""
+    return re.compile(rf"(## {re.escape(header)}\n(?:<!--.*?-->\n)?)")
+
+
+def _write_into_section(
+    path: Path, content: str, header: str, block: str, *, on_disk: bool
+) -> bool:
+    """Write *content* to *path* with *block* inserted under ``## <header>``.
+
+    The block goes right after the header and its optional comment line.
+    When *content* is exactly what is on disk (*on_disk*) and that point is
+    the end of the file, the block is simply appended; otherwise the file is
+    rewritten atomically, streaming the text before and after the insertion
+    point instead of concatenating a new copy.
+
+    Returns ``False`` (writing nothing) if the header is not present.
+    """
+    match = _section_pattern(header).search(content)
+    if not match:
+        return False
+    insert_pos = match.end()
+    if on_disk and insert_pos == len(content):
+        with open(path, "a") as f:
+            f.write(block)
+    else:
+        _atomic_write(path, content[:insert_pos], block, content[insert_pos:])
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Background dual-write to claude-flow HNSW memory
+# ---------------------------------------------------------------------------
+
+_HNSW_BATCH = 64
+_HNSW_QUEUE: "queue.Queue[tuple[str, dict]]" = queue.Queue()
+_hnsw_worker: threading.Thread | None = None
+_hnsw_worker_lock = threading.Lock()
+
+
+def _store_hnsw_batch(batch: list[tuple[str, dict]]) -> None:
+    """Store queued ``(entry, metadata)`` pairs, one bridge call per metadata run."""
+    try:
+        bridge = _get_bridge()
+    except ClaudeFlowUnavailable:
+        return
+    for metadata, group in itertools.groupby(batch, key=lambda item: item[1]):
+        try:
+            bridge.store_memory_batch(
+                [text for text, _meta in group],
+                namespace="knowledge",
+                metadata=metadata,
+            )
+        except ClaudeFlowUnavailable:
+            pass
+        except Exception as exc:
+            logger.warning("Failed to store knowledge in vector memory: %s", exc)
+
+
+def _hnsw_worker_loop() -> None:
+    """Drain the queue forever, storing up to ``_HNSW_BATCH`` entries per round."""
+    while True:
+        batch = [_HNSW_QUEUE.get()]
+        while len(batch) < _HNSW_BATCH:
+            try:
+                batch.append(_HNSW_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _store_hnsw_batch(batch)
+        finally:
+            for _ in batch:
+                _HNSW_QUEUE.task_done()
+
+
+def _enqueue_hnsw(entries: list[str], metadata: dict) -> None:
+    """Queue *entries* for the vector-memory dual-write, starting the worker lazily."""
+    global _hnsw_worker
+    with _hnsw_worker_lock:
+        if _hnsw_worker is None:
+            _hnsw_worker = threading.Thread(
+                target=_hnsw_worker_loop, name="knowledge-hnsw", daemon=True
+            )
+            _hnsw_worker.start()
+            atexit.register(flush_hnsw_queue)
+    for entry in entries:
+        _HNSW_QUEUE.put_nowait((entry, metadata))
+
+
+def flush_hnsw_queue() -> None:
+    """Block until every queued vector-memory write has been processed.
+
+    Registered with :mod:`atexit` once the first entry is queued, so learnings
+    are not lost when the process exits.
+    """
+    if _hnsw_worker is not None:
+        _HNSW_QUEUE.join()
+
+
 def append_learning(
     section: str,
     entry: str,
@@ -206,52 +590,89 @@ def append_learning(
         entry: The text to append.
         encyclopedia_path: Path to the encyclopedia file.
     """
-    if not encyclopedia_path.exists():
-        encyclopedia_path.parent.mkdir(parents=True, exist_ok=True)
-        encyclopedia_path.write_text(
-            "# Encyclopedia\n\n## Tricks\n\n## Decisions\n\n"
-            "## What Works\n\n## What Fails\n"
-        )
-        logger.info("Created encyclopedia at %s", encyclopedia_path)
-
-    content = encyclopedia_path.read_text()
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-    # Include user_id for collaborative tracking
-    try:
-        from core.collaboration import get_user_id
-
-        user_id = get_user_id()
-        formatted_entry = f"\n- [{timestamp}] ({user_id}) {entry}"
-    except Exception:
-        formatted_entry = f"\n- [{timestamp}] {entry}"
+    original = _load_or_create(encyclopedia_path)
+    timestamp = _minute_timestamp()
 
     # Ensure the target section exists (creates it if missing)
-    content, actual_header = _ensure_section(content, section)
+    content, actual_header = _ensure_section(original, section)
 
     # Find the section header and append after the comment line
-    pattern = rf"(## {re.escape(actual_header)}\n(?:<!--.*?-->\n)?)"
-    match = re.search(pattern, content)
-    if match:
-        insert_pos = match.end()
-        content = content[:insert_pos] + formatted_entry + content[insert_pos:]
-        encyclopedia_path.write_text(content)
+    if _write_into_section(
+        encyclopedia_path,
+        content,
+        actual_header,
+        _format_entries([entry], timestamp),
+        on_disk=content is original,
+    ):
         logger.info("Added entry to '%s' section", actual_header)
 
-        # Dual-write to claude-flow HNSW vector memory
-        try:
-            bridge = _get_bridge()
-            bridge.store_memory(
-                entry,
-                namespace="knowledge",
-                metadata={"section": actual_header, "timestamp": timestamp},
-            )
-        except ClaudeFlowUnavailable:
-            pass
+        # Dual-write to claude-flow HNSW vector memory (in the background)
+        _enqueue_hnsw([entry], {"section": actual_header, "timestamp": timestamp})
     else:
         logger.warning("Section '%s' not found in encyclopedia", section)
 
 
+def append_learnings(
+    section: str,
+    entries: list[str],
+    encyclopedia_path: Path = ENCYCLOPEDIA_PATH,
+) -> None:
+    """Append several learnings under one section with a single read and write.
+
+    Equivalent to calling :func:`append_learning` once per entry, but the
+    section is resolved once, the file is rewritten once and the vector-memory
+    dual-write is queued as one batch.
+
+    Args:
+        section: Section name, alias, or canonical type key.
+        entries: The texts to append, in logging order.
+        encyclopedia_path: Path to the encyclopedia file.
+    """
+    if not entries:
+        return
+
+    original = _load_or_create(encyclopedia_path)
+    timestamp = _minute_timestamp()
+    content, actual_header = _ensure_section(original, section)
+
+    # Entries are inserted at the top of the section, so reverse them to keep
+    # the same final order as repeated single appends.
+    if not _write_into_section(
+        encyclopedia_path,
+        content,
+        actual_header,
+        _format_entries(entries[::-1], timestamp),
+        on_disk=content is original,
+    ):
+        logger.warning("Section '%s' not found in encyclopedia", section)
+        return
+
+    logger.info("Added %d entries to '%s' section", len(entries), actual_header)
+    _enqueue_hnsw(entries, {"section": actual_header, "timestamp": timestamp})
+
+
+def _iter_bullets(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the stripped ``- [timestamp] ...`` bullet entries found in *lines*."""
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("- ["):
+            yield stripped
+
+
+def _entry_body(line: str) -> str:
+    """Return the text of a ``- [timestamp] (user) text`` bullet without its prefix.
+
+    Used as a dedup key so the same learning recorded at a different time
+    (or by a different user) is recognised as a duplicate.
+    """
+    body = line.strip()
+    if body.startswith("- ["):
+        body = body.split("] ", 1)[-1]
+        if body.startswith("(") and ") " in body:
+            body = body.split(") ", 1)[1]
+    return body.strip()
+
+
 def log_decision(decision: str, rationale: str) -> None:
     """Log a design decision with rationale."""
     entry = f"{decision} -- Rationale: {rationale}"
@@ -287,13 +708,140 @@ def sync_to_shared(
         encyclopedia_path: Path to project encyclopedia.
         shared_path: Path to shared knowledge directory.
     """
-    if not shared_path.exists():
-        shared_path.mkdir(parents=True, exist_ok=True)
+    shared_path.mkdir(parents=True, exist_ok=True)
 
     dest = shared_path / f"{project_name}.md"
-    if encyclopedia_path.exists():
-        dest.write_text(encyclopedia_path.read_text())
-        logger.info("Synced encyclopedia to %s", dest)
+    try:
+        _atomic_copy(encyclopedia_path, dest)
+    except FileNotFoundError:
+        return  # nothing to sync yet
+    logger.info("Synced encyclopedia to %s", dest)
+
+
+def sync_many_to_shared(
+    projects: list[tuple[str, Path]],
+    shared_path: Path = SHARED_KNOWLEDGE_PATH,
+    *,
+    max_workers: int = 8,
+) -> None:
+    """Sync several project encyclopedias to the shared store concurrently.
+
+    The copies are independent and I/O-bound, so they are overlapped on a
+    thread pool instead of running one blocking read/write pair at a time.
+
+    Args:
+        projects: ``(project_name, encyclopedia_path)`` pairs.
+        shared_path: Path to shared knowledge directory.
+        max_workers: Maximum number of concurrent copies.
+    """
+    if not projects:
+        return
+    shared_path.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(projects))) as pool:
+        futures = [
+            pool.submit(sync_to_shared, name, enc, shared_path)
+            for name, enc in projects
+        ]
+        for future in futures:
+            future.result()
+
+
+def _iter_hit_spans(
+    lowered: str, needle: str, line_starts: list[int]
+) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` offsets of the lines of *lowered* containing *needle*.
+
+    *line_starts* holds the offset of every line start.  Hits are found with
+    ``str.find`` and mapped to their line by bisection; since hits only move
+    forward, each bisection starts at the previous line.  Each line is
+    yielded once.
+    """
+    last = len(line_starts) - 1
+    pos = line = 0
+    while (hit := lowered.find(needle, pos)) != -1:
+        line = bisect.bisect_right(line_starts, hit, lo=line) - 1
+        start = line_starts[line]
+        end = line_starts[line + 1] - 1 if line < last else len(lowered)
+        yield start, end
+        pos = end + 1
+
+
+def _keyword_matches(encyclopedia_path: Path, query: str) -> list[str]:
+    """Return stripped lines of *encyclopedia_path* containing *query* (case-insensitive).
+
+    The lowered text is cached alongside the content (see :func:`_load`), so
+    a query is a ``str.find`` walk over it and only matching lines are
+    sliced out.  Each candidate line is re-checked, so results match a
+    per-line scan.
+    """
+    query_lower = query.lower()
+    cached = _load_or_none(encyclopedia_path)
+    if cached is None:
+        return []
+    if not query_lower:
+        return [line.strip() for line in cached.content.splitlines()]
+    if "\n" in query_lower or "\r" in query_lower:
+        return []  # a query spanning lines can never match a single line
+    if cached.content.isascii() and not query_lower.isascii():
+        return []  # lowered ASCII text cannot contain a non-ASCII needle
+
+    text, lowered = cached.content, cached.lowered
+    if not cached.offsets_match_lines:
+        lines = (line.strip() for line in text.splitlines())
+        return [line for line in lines if query_lower in line.lower()]
+
+    # Offsets line up, so the lowered slice stands in for ``line.lower()``
+    return [
+        text[start:end].strip()
+        for start, end in _iter_hit_spans(lowered, query_lower, cached.line_starts)
+        if query_lower in lowered[start:end].strip()
+    ]
+
+
+@functools.lru_cache(maxsize=1)
+def _search_pool() -> ThreadPoolExecutor:
+    """Shared pool running the remote search branches of search_knowledge."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="knowledge-search")
+
+
+def _semantic_hits(query: str) -> list[str]:
+    """Return stripped texts of claude-flow HNSW hits for *query*."""
+    try:
+        bridge = _get_bridge()
+        cf_result = bridge.query_memory(query, top_k=10)
+    except ClaudeFlowUnavailable:
+        return []
+    return [hit.get("text", "").strip() for hit in cf_result.get("results", [])]
+
+
+def _linked_hits(query: str) -> list[tuple[str, str]]:
+    """Return ``(text, source)`` pairs from linked-repository search."""
+    if not query or _search_all_linked is None:
+        return []
+    try:
+        return [
+            (hit.get("text", "").strip(), hit.get("source", "linked"))
+            for hit in _search_all_linked(query)
+        ]
+    except Exception:
+        return []
+
+
+# (resolved path, file stamp, query) -> (time stored, merged results)
+_QUERY_CACHE: dict[tuple, tuple[float, list[str]]] = {}
+_QUERY_CACHE_MAX = 256
+# Semantic and linked-repo hits can change without touching the local file
+_QUERY_CACHE_TTL = 30.0
+
+
+def _query_cache_key(query: str, encyclopedia_path: Path) -> tuple:
+    """Cache key that changes whenever the encyclopedia file does."""
+    try:
+        st = encyclopedia_path.stat()
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        stamp = None
+    return (encyclopedia_path.resolve(), stamp, query)
 
 
 def search_knowledge(
@@ -302,8 +850,10 @@ def search_knowledge(
 ) -> list[str]:
     """Search the encyclopedia, using semantic search when claude-flow is available.
 
-    Tries HNSW vector memory first for semantic results, then merges with
-    keyword matches from the markdown file.
+    Semantic (HNSW) and linked-repository searches run concurrently with the
+    local keyword scan; results are merged in that order (semantic, keyword,
+    linked) without duplicates.  Repeating a query returns the cached result
+    while the encyclopedia is unchanged, for up to ``_QUERY_CACHE_TTL`` seconds.
 
     Args:
         query: Search query string.
@@ -312,43 +862,42 @@ def search_knowledge(
     Returns:
         List of matching lines/entries.
     """
-    results: list[str] = []
+    key = _query_cache_key(query, encyclopedia_path)
+    now = time.monotonic()
+    hit = _QUERY_CACHE.pop(key, None)
+    if hit is not None and now - hit[0] < _QUERY_CACHE_TTL:
+        _QUERY_CACHE[key] = hit  # re-insert as most recently used
+        return list(hit[1])
 
-    # Try semantic search via claude-flow
-    try:
-        bridge = _get_bridge()
-        cf_result = bridge.query_memory(query, top_k=10)
-        for hit in cf_result.get("results", []):
-            text = hit.get("text", "").strip()
-            if text and text not in results:
-                results.append(text)
-    except ClaudeFlowUnavailable:
-        pass
+    pool = _search_pool()
+    semantic = pool.submit(_semantic_hits, query)
+    linked = pool.submit(_linked_hits, query)
 
     # Always merge with keyword search from markdown
-    if encyclopedia_path.exists():
-        query_lower = query.lower()
-        for line in encyclopedia_path.read_text().splitlines():
-            stripped = line.strip()
-            if query_lower in stripped.lower() and stripped not in results:
-                results.append(stripped)
-
-    # Cross-repo RAG: search linked repositories
-    if query:
-        try:
-            from core.cross_repo import search_all_linked
-
-            linked_results = search_all_linked(query)
-            for hit in linked_results:
-                text = hit.get("text", "").strip()
-                source = hit.get("source", "linked")
-                tagged = f"[{source}] {text}"
-                if tagged not in results and text not in results:
-                    results.append(tagged)
-        except Exception:
-            pass
+    keyword = _keyword_matches(encyclopedia_path, query)
 
-    return results
+    # Insertion-ordered dict doubles as the output list and its dedup set
+    merged: dict[str, None] = {}
+
+    # Semantic hits from claude-flow come first
+    for text in semantic.result():
+        if text:
+            merged.setdefault(text, None)
+
+    for stripped in keyword:
+        merged.setdefault(stripped, None)
+
+    # Cross-repo RAG: hits from linked repositories, tagged with their source,
+    # skipped when the same text is already present untagged
+    for text, source in linked.result():
+        if text not in merged:
+            merged.setdefault(f"[{source}] {text}", None)
+
+    results = list(merged)
+    if len(_QUERY_CACHE) >= _QUERY_CACHE_MAX:
+        _QUERY_CACHE.pop(next(iter(_QUERY_CACHE)))  # evict least recently used
+    _QUERY_CACHE[key] = (now, results)
+    return list(results)
 
 
 def export_knowledge(
@@ -367,12 +916,13 @@ def export_knowledge(
     Returns:
         Path to the exported file.
     """
-    if not encyclopedia_path.exists():
+    cached = _load_or_none(encyclopedia_path)
+    if cached is None:
         raise FileNotFoundError(f"Encyclopedia not found: {encyclopedia_path}")
 
-    stats = get_encyclopedia_stats(encyclopedia_path)
-    content = encyclopedia_path.read_text()
-    entries = search_knowledge("", encyclopedia_path)  # Get all lines
+    # Derive stats from the same snapshot that is exported
+    content = cached.content
+    stats = _stats_from_content(content)
 
     export_data = {
         "project": project_name,
@@ -384,7 +934,7 @@ def export_knowledge(
     if output_path is None:
         output_path = encyclopedia_path.parent / f"{project_name}_export.json"
 
-    output_path.write_text(json.dumps(export_data, indent=2))
+    _atomic_dump_json(output_path, export_data)
     logger.info("Exported knowledge to %s", output_path)
     return output_path
 
@@ -405,37 +955,91 @@ def import_knowledge(
     Returns:
         Number of entries imported.
     """
-    if not import_path.exists():
-        raise FileNotFoundError(f"Import file not found: {import_path}")
+    try:
+        raw = import_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Import file not found: {import_path}") from None
 
-    data = json.loads(import_path.read_text())
+    data = _loads_json(raw)
     imported_content = data.get("content", "")
 
     if not imported_content:
         return 0
 
-    if not merge or not encyclopedia_path.exists():
+    existing: set[str] | None = None
+    if merge:
+        try:
+            with encyclopedia_path.open() as f:
+                existing = set(_iter_bullets(f))
+        except FileNotFoundError:
+            pass  # nothing to merge into: import as a fresh copy
+
+    if existing is None:
         encyclopedia_path.parent.mkdir(parents=True, exist_ok=True)
-        encyclopedia_path.write_text(imported_content)
+        _atomic_write(encyclopedia_path, imported_content)
         logger.info("Replaced encyclopedia with imported content")
-        return len(
-            [l for l in imported_content.splitlines() if l.strip().startswith("- [")]
-        )
+        return sum(1 for _ in _iter_bullets(io.StringIO(imported_content)))
 
-    # Merge: extract entries from imported content and append
-    existing = encyclopedia_path.read_text()
-    count = 0
-    for line in imported_content.splitlines():
-        stripped = line.strip()
-        if stripped.startswith("- [") and stripped not in existing:
-            # Find which section it belongs to by context
-            append_learning(
-                "Tricks", stripped.lstrip("- "), encyclopedia_path=encyclopedia_path
-            )
-            count += 1
+    # Merge: append imported entries not already present
+    new_entries = [
+        stripped.lstrip("- ")
+        for stripped in _iter_bullets(io.StringIO(imported_content))
+        if stripped not in existing
+    ]
+
+    append_learnings("Tricks", new_entries, encyclopedia_path=encyclopedia_path)
+    logger.info("Imported %d entries", len(new_entries))
+    return len(new_entries)
+
+
+def _iter_rule_blocks(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the raw rule blocks of a cheatsheet read as newline-terminated *lines*.
 
-    logger.info("Imported %d entries", count)
-    return count
+    Blocks are separated by a ``---`` line or start at a ``## `` header (whose
+    marker is dropped), exactly like splitting the text on ``"\\n---\\n"`` or
+    ``"\\n## "``.  The first line never splits, and neither does the line
+    right after a ``---`` separator, whose line break it already consumed.
+    """
+    block: list[str] = []
+    can_split = False
+    raw = ""
+    for raw in lines:
+        line = raw.removesuffix("\n")
+        if can_split and line == "---" and raw.endswith("\n"):
+            yield "\n".join(block)
+            block = []
+            can_split = False
+            continue
+        if can_split and line.startswith("## "):
+            yield "\n".join(block)
+            block = [line[3:]]
+        else:
+            block.append(line)
+        can_split = True
+    if raw.endswith("\n"):
+        block.append("")  # the text after the final line break
+    yield "\n".join(block)
+
+
+def _rule_titles(cheatsheet: Path) -> set[str]:
+    """Return every line of *cheatsheet* that could title an existing rule.
+
+    Any line can start a block; ``## `` headers are also indexed without the
+    marker since :func:`_iter_rule_blocks` strips it.  The file is streamed so
+    only the set is kept in memory; a missing file has no titles.
+    """
+    titles: set[str] = set()
+    try:
+        with cheatsheet.open(buffering=1 << 16) as f:
+            for line in f:
+                line = line.strip()
+                if line and line != "---":
+                    titles.add(line)
+                    if line.startswith("## "):
+                        titles.add(line[3:].strip())
+    except FileNotFoundError:
+        pass
+    return titles
 
 
 def sync_learnings_to_project(source_project: Path, target_project: Path) -> dict:
@@ -452,58 +1056,64 @@ def sync_learnings_to_project(source_project: Path, target_project: Path) -> dic
     src_enc = source_project / "knowledge" / "ENCYCLOPEDIA.md"
     tgt_enc = target_project / "knowledge" / "ENCYCLOPEDIA.md"
 
-    if src_enc.exists():
-        src_content = src_enc.read_text()
-        tgt_content = tgt_enc.read_text() if tgt_enc.exists() else ""
-
-        # Split source into entries by "## " section headers
-        # Extract individual bullet entries (lines starting with "- [")
-        src_entries = [
-            line.strip()
-            for line in src_content.splitlines()
-            if line.strip().startswith("- [")
-        ]
-        tgt_lines_set = set(tgt_content.splitlines())
+    # Extract individual bullet entries (lines starting with "- [")
+    try:
+        with src_enc.open() as f:
+            src_entries = list(_iter_bullets(f))
+    except FileNotFoundError:
+        src_entries = []
+
+    if src_entries:
+        tgt_entries: set[str] = set()
+        tgt_exists = True
+        try:
+            with tgt_enc.open() as f:
+                tgt_entries = set(_iter_bullets(f))
+        except FileNotFoundError:
+            tgt_exists = False
+        tgt_bodies = {_entry_body(line) for line in tgt_entries}
 
         new_entries = []
         for entry in src_entries:
             # Check for duplicate by exact match or matching content after timestamp
-            if entry not in tgt_lines_set and entry.strip() not in tgt_content:
-                new_entries.append(entry)
+            body = _entry_body(entry)
+            if entry in tgt_entries or body in tgt_bodies:
+                continue
+            # Remember it so entries repeated in the source transfer only once
+            tgt_bodies.add(body)
+            new_entries.append(entry)
 
-        if new_entries and tgt_enc.exists():
+        if new_entries and tgt_exists:
             # Append new entries to the "Tricks" section (general catch-all)
-            for entry in new_entries:
-                append_learning(
-                    "Tricks",
-                    entry.lstrip("- ").lstrip(),
-                    encyclopedia_path=tgt_enc,
-                )
+            append_learnings(
+                "Tricks",
+                [entry.lstrip("- ").lstrip() for entry in new_entries],
+                encyclopedia_path=tgt_enc,
+            )
             result["encyclopedia_transferred"] = len(new_entries)
 
     # --- Cheatsheet / meta-rules transfer ---
     src_cheat = source_project / "knowledge" / "CHEATSHEET.md"
     tgt_cheat = target_project / "knowledge" / "CHEATSHEET.md"
 
-    if src_cheat.exists():
-        src_rules = src_cheat.read_text()
-        tgt_rules = tgt_cheat.read_text() if tgt_cheat.exists() else ""
-
-        # Split rules by "---" separators or "## " headers
-        import re as _re
-
-        src_blocks = _re.split(r"\n---\n|\n## ", src_rules)
-        tgt_blocks_text = tgt_rules
-
-        new_rules = []
-        for block in src_blocks:
-            block = block.strip()
-            if not block:
-                continue
-            # Use the first line as the dedup key
-            first_line = block.splitlines()[0].strip() if block.splitlines() else ""
-            if first_line and first_line not in tgt_blocks_text:
-                new_rules.append(block)
+    try:
+        src_file = src_cheat.open(buffering=1 << 16)
+    except FileNotFoundError:
+        src_file = None
+
+    if src_file is not None:
+        with src_file:
+            tgt_titles = _rule_titles(tgt_cheat)
+            new_rules = []
+            # Split rules by "---" separators or "## " headers in one pass
+            for block in _iter_rule_blocks(src_file):
+                block = block.strip()
+                if not block:
+                    continue
+                # Use the first line as the dedup key
+                first_line = block.split("\n", 1)[0].strip()
+                if first_line and first_line not in tgt_titles:
+                    new_rules.append(block)
 
         if new_rules:
             tgt_cheat.parent.mkdir(parents=True, exist_ok=True)
@@ -526,28 +1136,30 @@ def get_encyclopedia_stats(
     Returns:
         Dict with counts per canonical section name.
     """
-    if not encyclopedia_path.exists():
+    cached = _load_or_none(encyclopedia_path)
+    if cached is None:
         return {}
 
-    content = encyclopedia_path.read_text()
+    return _stats_from_content(cached.content)
+
+
+def _stats_from_content(content: str) -> dict:
+    """Count bullet entries per canonical section in encyclopedia *content*."""
     canonical_sections = ["Tricks", "Decisions", "What Works", "What Doesn't Work"]
-    stats = {}
 
+    # One pass: count "- [" bullets under every "## " header
+    counts: dict[str, int] = {}
+    current: str | None = None
+    for line in content.splitlines():
+        if line.startswith("## "):
+            current = line[3:].strip()
+            counts.setdefault(current, 0)
+        elif current is not None and line.strip().startswith("- ["):
+            counts[current] += 1
+
+    stats = {}
     for section in canonical_sections:
         actual_header = find_section(content, section)
-        if actual_header is None:
-            stats[section] = 0
-            continue
-        pattern = rf"## {re.escape(actual_header)}\n(.*?)(?=\n## |\Z)"
-        match = re.search(pattern, content, re.DOTALL)
-        if match:
-            entries = [
-                line
-                for line in match.group(1).strip().splitlines()
-                if line.strip().startswith("- [")
-            ]
-            stats[section] = len(entries)
-        else:
-            stats[section] = 0
+        stats[section] = counts.get(actual_header, 0) if actual_header else 0
 
     return stats
@@ -11,7 +11,9 @@ unload when context budget is tight.
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Dict, List
 
 logger = logging.getLogger(__name__)
@@ -25,8 +27,11 @@ _DEFAULT_TOKEN_COST_BY_TIER: Dict[int, int] = {
 }
 _FALLBACK_TOKEN_COST = 1000
 
+# Recent task -> matched MCP names; cleared whenever the registry changes
+_MATCH_CACHE_MAX = 256
 
-@dataclass
+
+@dataclass(slots=True)
 class _MCPEntry:
     """Internal bookkeeping for a registered MCP."""
 
@@ -37,9 +42,12 @@ class _MCPEntry:
     loaded: bool = False
     # Normalised keywords for fast matching
     _keywords_lower: list[str] = field(default_factory=list, repr=False)
+    # Token cost depends only on the tier, so it is fixed at registration
+    _cost: int = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._keywords_lower = [kw.lower() for kw in self.trigger_keywords]
+        self._cost = _DEFAULT_TOKEN_COST_BY_TIER.get(self.tier, _FALLBACK_TOKEN_COST)
 
 
 class LazyMCPLoader:
@@ -52,6 +60,9 @@ class LazyMCPLoader:
 
     def __init__(self) -> None:
         self._registry: Dict[str, _MCPEntry] = {}
+        # Inverted index: lowercase keyword -> names of MCPs it triggers
+        self._kw_to_mcps: Dict[str, set[str]] = defaultdict(set)
+        self._match_cache: Dict[str, frozenset[str]] = {}
 
     # ── Registration ────────────────────────────────────────────────
 
@@ -67,31 +78,69 @@ class LazyMCPLoader:
         If *name* is already registered the entry is silently overwritten
         (latest-write-wins), which allows hot-reloading config changes.
         """
-        self._registry[name] = _MCPEntry(
+        self._match_cache.clear()
+        old = self._registry.get(name)
+        if old is not None:
+            self._unindex(old)
+        entry = _MCPEntry(
             name=name,
             config=config,
             tier=tier,
             trigger_keywords=trigger_keywords,
         )
+        self._registry[name] = entry
+        for kw in entry._keywords_lower:
+            self._kw_to_mcps[kw].add(name)
         logger.debug(
             "Registered MCP %s (tier %d, keywords=%s)", name, tier, trigger_keywords
         )
 
+    def _unindex(self, entry: _MCPEntry) -> None:
+        """Drop *entry*'s keywords from the inverted index."""
+        for kw in entry._keywords_lower:
+            names = self._kw_to_mcps.get(kw)
+            if names is not None:
+                names.discard(entry.name)
+                if not names:
+                    del self._kw_to_mcps[kw]
+
     # ── Task matching ───────────────────────────────────────────────
 
+    def _match(self, task_lower: str) -> frozenset[str]:
+        """Names of MCPs with a trigger keyword contained in *task_lower*.
+
+        Each distinct keyword is tested once, however many MCPs share it.
+        Results are memoized per task so back-to-back ``get_needed_mcps``
+        and ``optimize_context`` calls scan the keywords only once.
+        """
+        cache = self._match_cache
+        hit = cache.pop(task_lower, None)
+        if hit is not None:
+            cache[task_lower] = hit  # re-insert as most recently used
+            return hit
+
+        matched: set[str] = set()
+        for kw, names in self._kw_to_mcps.items():
+            if kw in task_lower:
+                matched.update(names)
+        result = frozenset(matched)
+
+        if len(cache) >= _MATCH_CACHE_MAX:
+            cache.pop(next(iter(cache)))  # evict least recently used
+        cache[task_lower] = result
+        return result
+
     def get_needed_mcps(self, task: str) -> list[str]:
         """Determine which registered MCPs are relevant for *task*.
 
         Matching is case-insensitive keyword containment: if any of an
         MCP's trigger keywords appear as a substring of *task*, that MCP
-        is considered needed.
+        is considered needed.  Names are returned in registration order.
         """
-        task_lower = task.lower()
-        needed: list[str] = []
-        for entry in self._registry.values():
-            if any(kw in task_lower for kw in entry._keywords_lower):
-                needed.append(entry.name)
-        return needed
+        matched = self._match(task.lower())
+        if not matched:
+            return []
+        return [name for name in self._registry if name in matched]
 
     # ── Loading / unloading ─────────────────────────────────────────
 
@@ -149,31 +198,30 @@ class LazyMCPLoader:
         Returns a list of MCP names ordered from "most beneficial to drop"
         to "least beneficial to drop".
         """
-        task_lower = current_task.lower()
+        matched = self._match(current_task.lower())
+        registry_get = self._registry.get
         candidates: list[_MCPEntry] = []
 
-        for name in active_mcps:
-            entry = self._registry.get(name)
-            if entry is None:
-                continue
+        # dict.fromkeys drops repeated names but keeps the caller's order
+        for name in dict.fromkeys(active_mcps):
             # Keep if any keyword matches
-            if any(kw in task_lower for kw in entry._keywords_lower):
+            if name in matched:
                 continue
-            candidates.append(entry)
+            entry = registry_get(name)
+            if entry is not None:
+                candidates.append(entry)
 
         # Higher tier first → drop those before essentials
-        candidates.sort(key=lambda e: e.tier, reverse=True)
+        candidates.sort(key=attrgetter("tier"), reverse=True)
         return [c.name for c in candidates]
 
     def estimate_context_cost(self, mcps: list[str]) -> int:
         """Estimate the token cost of having *mcps* loaded.
 
-        Uses a per-tier heuristic; unknown MCP names contribute zero.
+        Uses a per-tier heuristic; unknown MCP names contribute zero and a
+        name listed more than once is only counted once.
         """
-        total = 0
-        for name in mcps:
-            entry = self._registry.get(name)
-            if entry is None:
-                continue
-            total += _DEFAULT_TOKEN_COST_BY_TIER.get(entry.tier, _FALLBACK_TOKEN_COST)
-        return total
+        registry = self._registry
+        return sum(
+            registry[name]._cost for name in dict.fromkeys(mcps) if name in registry
+        )
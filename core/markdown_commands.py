@@ -2,26 +2,58 @@
 
 import logging
 import re
+import shlex
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice, repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
-# Regex for fenced code blocks: ```lang\n...\n```
+# Regex for fenced code blocks: ```lang\n...\n```.  Blank lines after the
+# opening fence are skipped by an atomic group: a plain \s*\n backtracks
+# through them, rescanning the rest of the text each time a fence is unclosed.
 _CODE_BLOCK_RE = re.compile(
-    r"^```(\w*)\s*\n(.*?)^```",
+    r"^```(\w*)(?>(?:[^\S\n]*\n)+)(.*?)^```",
     re.MULTILINE | re.DOTALL,
 )
 
+# Opening fence line for the line-by-line scanner: ```lang, then whitespace
+_FENCE_OPEN_RE = re.compile(r"```(\w*)\s*\n")
+
 # Regex for TODO checkbox items: - [x] or - [ ] with optional (**Pn**) priority
 _TODO_RE = re.compile(
     r"^-\s+\[([ xX])\]\s+(?:\(\*\*(\w+)\*\*\)\s+)?(.+)$",
     re.MULTILINE,
 )
 
-# Regex for markdown headings (used for runbook step names)
-_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+# Regex for runbook scanning: a markdown heading (step name) or a fenced code
+# block, so one pass sees both in document order
+_RUNBOOK_RE = re.compile(
+    r"^(?P<heading>#{1,6}[ \t]+(?P<title>[^\n]+))$"
+    r"|^```(?P<language>\w*)(?>(?:[^\S\n]*\n)+)(?P<code>.*?)^```",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Characters that need a shell to interpret: operators, expansions, quoting,
+# comments, variable assignments and multi-line scripts
+_SHELL_META_RE = re.compile(r"[|&;<>()$`\\\"'\n*?{}\[\]~#=!]")
+
+
+def _simple_argv(code: str) -> list[str] | None:
+    """Split a one-line command into argv when it needs no shell.
+
+    Returns ``None`` for anything with shell syntax, and for builtins or
+    unknown programs, so those keep the shell's own behaviour.
+    """
+    if _SHELL_META_RE.search(code):
+        return None
+    argv = shlex.split(code)
+    if not argv or shutil.which(argv[0]) is None:
+        return None
+    return argv
 
 
 # ---------------------------------------------------------------------------
@@ -47,6 +79,34 @@ def extract_code_blocks(md_text: str) -> list[dict]:
     return blocks
 
 
+def iter_code_blocks(lines: Iterable[str]) -> Iterator[dict]:
+    """Yield fenced code blocks from markdown *lines* as each one closes.
+
+    Streaming counterpart of :func:`extract_code_blocks` with the same
+    results, for documents that are read or generated incrementally.
+    *lines* must keep their ``\\n`` endings, as iterating a text file does.
+    """
+    offset = 0
+    inside = False
+    lang = ""
+    start = 0
+    buf: list[str] = []
+    for line in lines:
+        if not inside:
+            if line.startswith("```") and (m := _FENCE_OPEN_RE.fullmatch(line)):
+                inside = True
+                lang = m.group(1)
+                start = offset
+                buf = []
+        elif line.startswith("```"):
+            inside = False
+            yield {"language": lang, "code": "".join(buf).rstrip("\n"), "start": start}
+        # Like the regex, drop blank lines right after the opening fence
+        elif buf or not line.isspace():
+            buf.append(line)
+        offset += len(line)
+
+
 def parse_todo_to_tasks(md_path: Path) -> list[dict]:
     """Parse a TODO.md with checkbox items into task dicts.
 
@@ -79,33 +139,79 @@ def parse_runbook(md_path: Path) -> list[dict]:
     """
     text = md_path.read_text()
 
-    # Build a sorted list of (offset, heading_text) from headings
-    headings: list[tuple[int, str]] = [
-        (m.start(), m.group(2).strip()) for m in _HEADING_RE.finditer(text)
-    ]
-
-    blocks = extract_code_blocks(text)
     steps: list[dict] = []
-    for block in blocks:
-        # Find the nearest heading that precedes this code block
-        heading = ""
-        for h_offset, h_text in reversed(headings):
-            if h_offset < block["start"]:
-                heading = h_text
-                break
+    # Headings and blocks come out of a single scan in document order, so the
+    # latest heading seen is the one preceding each block.  Heading-like lines
+    # inside a fenced block are consumed with the block, not taken as names.
+    heading = ""
+    for m in _RUNBOOK_RE.finditer(text):
+        if m.lastgroup == "heading":
+            heading = m.group("title").strip()
+            continue
         steps.append(
             {
                 "heading": heading,
-                "language": block["language"],
-                "code": block["code"],
+                "language": m.group("language") or "",
+                "code": m.group("code").rstrip("\n"),
             }
         )
     return steps
 
 
+def _run_step(step: dict, dry_run: bool) -> dict:
+    """Execute (or skip) one runbook step and return its result dict."""
+    language = step["language"]
+    code = step["code"]
+    heading = step.get("heading", "")
+    skipped = dry_run
+    output = ""
+    returncode: int | None = None
+    if dry_run:
+        logger.info("DRY-RUN skip: %s", step.get("heading", code[:40]))
+    elif language in ("bash", "sh", "shell", "zsh"):
+        # Run simple commands directly to save spawning /bin/sh
+        argv = _simple_argv(code)
+        try:
+            proc = subprocess.run(
+                code if argv is None else argv,
+                shell=argv is None,
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            output = proc.stdout.strip()
+            returncode = proc.returncode
+        except subprocess.TimeoutExpired:
+            output = "TIMEOUT"
+            returncode = -1
+    elif language == "python":
+        # For safety, python blocks are only exec'd in-process in non-dry mode
+        try:
+            local_ns: dict[str, Any] = {}
+            exec(code, {}, local_ns)  # noqa: S102
+            output = str(local_ns) if local_ns else ""
+            returncode = 0
+        except Exception as exc:  # noqa: BLE001
+            output = str(exc)
+            returncode = 1
+    else:
+        output = f"unsupported language: {language}"
+        skipped = True
+
+    return {
+        "heading": heading,
+        "language": language,
+        "code": code,
+        "skipped": skipped,
+        "output": output,
+        "returncode": returncode,
+    }
+
+
 def execute_runbook(
     steps: list[dict],
     dry_run: bool = True,
+    parallel: int = 1,
 ) -> list[dict]:
     """Execute parsed runbook steps.
 
@@ -115,71 +221,39 @@ def execute_runbook(
         Output of :func:`parse_runbook`.
     dry_run:
         When ``True`` (the default), no commands are actually executed.
+    parallel:
+        Number of steps to run concurrently.  Only use values above 1 when
+        the steps do not depend on each other; results keep step order.
 
     Returns a list of result dicts with keys: ``heading``, ``language``,
     ``code``, ``skipped``, ``output``, ``returncode``.
     """
-    results: list[dict] = []
-    for step in steps:
-        result: dict[str, Any] = {
-            "heading": step.get("heading", ""),
-            "language": step["language"],
-            "code": step["code"],
-            "skipped": dry_run,
-            "output": "",
-            "returncode": None,
-        }
-        if dry_run:
-            logger.info("DRY-RUN skip: %s", step.get("heading", step["code"][:40]))
-        elif step["language"] in ("bash", "sh", "shell", "zsh"):
-            try:
-                proc = subprocess.run(
-                    step["code"],
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
-                result["output"] = proc.stdout.strip()
-                result["returncode"] = proc.returncode
-            except subprocess.TimeoutExpired:
-                result["output"] = "TIMEOUT"
-                result["returncode"] = -1
-        elif step["language"] == "python":
-            # For safety, python blocks are only exec'd in-process in non-dry mode
-            try:
-                local_ns: dict[str, Any] = {}
-                exec(step["code"], {}, local_ns)  # noqa: S102
-                result["output"] = str(local_ns) if local_ns else ""
-                result["returncode"] = 0
-            except Exception as exc:  # noqa: BLE001
-                result["output"] = str(exc)
-                result["returncode"] = 1
-        else:
-            result["output"] = f"unsupported language: {step['language']}"
-            result["skipped"] = True
-
-        results.append(result)
-    return results
+    if parallel <= 1 or len(steps) < 2:
+        return [_run_step(step, dry_run) for step in steps]
+    with ThreadPoolExecutor(max_workers=min(parallel, len(steps))) as pool:
+        return list(pool.map(_run_step, steps, repeat(dry_run)))
 
 
 def update_todo_status(md_path: Path, task_idx: int, status: bool) -> None:
     """Check or uncheck a TODO checkbox item by its index (0-based).
 
-    Rewrites the file in-place.
+    Only the checkbox character is overwritten in place; the rest of the
+    file, line endings included, is left untouched.
     """
-    text = md_path.read_text()
-    matches = list(_TODO_RE.finditer(text))
-    if task_idx < 0 or task_idx >= len(matches):
-        raise IndexError(
-            f"task_idx {task_idx} out of range (found {len(matches)} tasks)"
-        )
+    text = md_path.read_bytes().decode("utf-8")
+    # Stop at the wanted match instead of collecting every one
+    m = None
+    if task_idx >= 0:
+        m = next(islice(_TODO_RE.finditer(text), task_idx, None), None)
+    if m is None:
+        found = sum(1 for _ in _TODO_RE.finditer(text))
+        raise IndexError(f"task_idx {task_idx} out of range (found {found} tasks)")
 
-    m = matches[task_idx]
-    mark = "x" if status else " "
-    # Replace just the checkbox character (group 1)
-    new_text = text[: m.start(1)] + mark + text[m.end(1) :]
-    md_path.write_text(new_text)
+    # Checkbox marks are single ASCII bytes, so one byte can be patched
+    offset = len(text[: m.start(1)].encode("utf-8"))
+    with open(md_path, "r+b") as f:
+        f.seek(offset)
+        f.write(b"x" if status else b" ")
 
 
 def generate_task_file(tasks: list[dict], output: Path) -> Path:
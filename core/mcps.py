@@ -6,13 +6,23 @@ full MCP catalogs (``defaults/MCP_CATALOG.md`` and
 ``defaults/raggable_mcps.md``) and suggests an install.
 """
 
+import functools
+import hashlib
 import json
 import logging
 import subprocess
+import time
 from pathlib import Path
-from typing import Set
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Set
 
 from core.claude_flow import ClaudeFlowUnavailable, _get_bridge
+from core.lazy_mcp import LazyMCPLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +30,97 @@ MCP_CONFIG = Path(__file__).parent.parent / "templates/config/mcp-nucleus.json"
 MCP_CATALOG = Path(__file__).parent.parent / "defaults" / "MCP_CATALOG.md"
 RAGGABLE_CATALOG = Path(__file__).parent.parent / "defaults" / "raggable_mcps.md"
 
+# Successful installs leave a marker here so repeat calls skip npm/npx
+INSTALL_MARKER_DIR = Path.home() / ".ricet" / "installed-mcps"
+_INSTALL_MARKER_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+
+def _read_json(path: Path) -> dict:
+    """Parse the JSON file at *path*, using orjson when it is installed."""
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 def load_mcp_config() -> dict:
     """Load MCP configuration."""
-    with open(MCP_CONFIG) as f:
-        return json.load(f)
+    return _read_json(MCP_CONFIG)
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_mcp_config(path: Path, mtime_ns: int) -> dict:
+    """Parse *path*; *mtime_ns* is only part of the cache key.
+
+    The dict is shared by the derived caches below, so it must not be
+    mutated; ``load_mcp_config`` parses a fresh one for callers.
+    """
+    return _read_json(path)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_tier_keywords(
+    path: Path, mtime_ns: int
+) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Lowercased trigger keywords of each optional tier in *path*'s config."""
+    return tuple(
+        (tier_name, tuple(kw.lower() for kw in keywords))
+        for tier_name, tier_config in _parse_mcp_config(path, mtime_ns).items()
+        if tier_name != "tier1_essential"
+        and (keywords := tier_config.get("trigger_keywords"))
+    )
+
+
+def _tier_keywords() -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """(tier, keywords) pairs for classification, rebuilt when the config changes."""
+    return _build_tier_keywords(MCP_CONFIG, MCP_CONFIG.stat().st_mtime_ns)
+
+
+_NO_MCPS: Mapping[str, dict] = MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=1)
+def _build_tier_mcps(path: Path, mtime_ns: int) -> dict[str, Mapping[str, dict]]:
+    """Tier name -> its ``mcps`` mapping in *path*'s config."""
+    return {
+        tier_name: tier_config.get("mcps") or _NO_MCPS
+        for tier_name, tier_config in _parse_mcp_config(path, mtime_ns).items()
+    }
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of *path*, or ``None`` when it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _build_catalog_section(
+    catalogs: tuple[tuple[Path, Optional[int]], ...],
+) -> Optional[str]:
+    """Catalog tail of the search prompt; mtimes are only part of the key."""
+    # Decoding the bytes directly skips the text layer's newline translation,
+    # which is most of read_text()'s cost on these ~200 KB files
+    parts = [
+        path.read_bytes().decode("utf-8")
+        for path, mtime_ns in catalogs
+        if mtime_ns is not None
+    ]
+    if not parts:
+        return None
+    return "--- CATALOG ---\n" + "\n\n".join(parts)
+
+
+def _catalog_section() -> Optional[str]:
+    """Combined MCP catalogs for the prompt, rebuilt only when a file changes.
+
+    Returns ``None`` when neither catalog exists.
+    """
+    return _build_catalog_section(
+        tuple((path, _mtime_ns(path)) for path in (MCP_CATALOG, RAGGABLE_CATALOG))
+    )
 
 
 def get_claude_flow_mcp_config() -> dict:
@@ -52,46 +148,31 @@ def get_claude_flow_mcp_config() -> dict:
         return {}
 
 
-def classify_task(task_description: str) -> Set[str]:
-    """Determine which MCP tiers to load based on task keywords."""
-    config = load_mcp_config()
+def _classify(
+    task_description: str, tier_keywords: tuple[tuple[str, tuple[str, ...]], ...]
+) -> Set[str]:
+    """Tiers whose lowercased *tier_keywords* occur in *task_description*."""
     task_lower = task_description.lower()
 
     tiers_to_load = {"tier1_essential"}  # Always load tier 1
 
-    for tier_name, tier_config in config.items():
-        if tier_name == "tier1_essential":
-            continue
-        keywords = tier_config.get("trigger_keywords", [])
+    for tier_name, keywords in tier_keywords:
         if any(kw in task_lower for kw in keywords):
             tiers_to_load.add(tier_name)
 
     return tiers_to_load
 
 
-def get_mcps_for_task(task_description: str) -> dict:
-    """Get all MCPs needed for a task.
-
-    MCPs are registered through LazyMCPLoader so they are tracked but not
-    fully loaded until explicitly requested.  The returned dict still
-    contains the same MCP configs for backward compatibility.
-    """
-    from core.lazy_mcp import LazyMCPLoader
-
-    config = load_mcp_config()
-    tiers = classify_task(task_description)
+def classify_task(task_description: str) -> Set[str]:
+    """Determine which MCP tiers to load based on task keywords."""
+    return _classify(task_description, _tier_keywords())
 
-    mcps = {}
-    for tier in tiers:
-        tier_mcps = config.get(tier, {}).get("mcps", {})
-        mcps.update(tier_mcps)
 
-    # Register discovered MCPs through LazyMCPLoader for deferred loading.
-    # The loader is instantiated per-call; a module-level singleton could be
-    # used if cross-call state is needed later.
+@functools.lru_cache(maxsize=1)
+def _build_lazy_loader(path: Path, mtime_ns: int) -> LazyMCPLoader:
+    """LazyMCPLoader with the MCPs of every tier in *path*'s config registered."""
     lazy = LazyMCPLoader()
-    for tier_name in tiers:
-        tier_cfg = config.get(tier_name, {})
+    for tier_name, tier_cfg in _parse_mcp_config(path, mtime_ns).items():
         tier_num = _tier_name_to_num(tier_name)
         keywords = tier_cfg.get("trigger_keywords", [])
         for mcp_name, mcp_cfg in tier_cfg.get("mcps", {}).items():
@@ -101,8 +182,38 @@ def get_mcps_for_task(task_description: str) -> dict:
                 tier=tier_num,
                 trigger_keywords=keywords,
             )
+    return lazy
+
+
+def _lazy_loader() -> LazyMCPLoader:
+    """Shared loader for the current config, rebuilt when the file changes.
+
+    An MCP is only needed when one of its tier's keywords occurs in the
+    task, which is also when :func:`classify_task` selects that tier, so
+    registering every tier up front matches per-task registration.
+    """
+    return _build_lazy_loader(MCP_CONFIG, MCP_CONFIG.stat().st_mtime_ns)
+
+
+def get_mcps_for_task(task_description: str) -> dict:
+    """Get all MCPs needed for a task.
+
+    MCPs are registered once per config with a shared LazyMCPLoader, so
+    they are tracked but not fully loaded until a task needs them.  The
+    returned dict still contains the same MCP configs for backward
+    compatibility.
+    """
+    # One stat serves every cached view, so all come from the same config
+    mtime_ns = MCP_CONFIG.stat().st_mtime_ns
+    tier_mcps = _build_tier_mcps(MCP_CONFIG, mtime_ns)
+    tiers = _classify(task_description, _build_tier_keywords(MCP_CONFIG, mtime_ns))
+
+    mcps = {}
+    for tier in tiers:
+        mcps.update(tier_mcps.get(tier, _NO_MCPS))
 
     # Only load MCPs that the lazy loader considers needed for this task.
+    lazy = _build_lazy_loader(MCP_CONFIG, mtime_ns)
     needed = lazy.get_needed_mcps(task_description)
     for name in needed:
         lazy.load_mcp(name)
@@ -112,10 +223,10 @@ def get_mcps_for_task(task_description: str) -> dict:
 
 def _tier_name_to_num(tier_name: str) -> int:
     """Convert a tier config key like 'tier2_research' to its numeric tier."""
-    import re as _re
-
-    m = _re.match(r"tier(\d+)", tier_name)
-    return int(m.group(1)) if m else 1
+    if not tier_name.startswith("tier"):
+        return 1
+    head = tier_name[4:].split("_", 1)[0]
+    return int(head) if head.isdecimal() else 1
 
 
 def get_priority_mcps() -> dict:
@@ -144,6 +255,14 @@ def get_priority_mcps() -> dict:
     return priority
 
 
+def _npx_package(args: Iterable[str]) -> Optional[str]:
+    """First non-flag entry of an npx ``args`` list (the package), if any."""
+    for arg in args:
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
 def install_priority_mcps() -> dict[str, bool]:
     """Install all tier-0 priority MCP servers.
 
@@ -155,8 +274,7 @@ def install_priority_mcps() -> dict[str, bool]:
         source = cfg.get("source", "")
         if not source:
             # For npx-based MCPs, attempt a dry-run to verify availability
-            cmd_parts = cfg.get("args", [])
-            pkg = next((a for a in cmd_parts if not a.startswith("-")), None)
+            pkg = _npx_package(cfg.get("args", ()))
             if pkg:
                 source = pkg
             else:
@@ -166,8 +284,27 @@ def install_priority_mcps() -> dict[str, bool]:
     return results
 
 
-def install_mcp(mcp_name: str, source: str) -> bool:
-    """Install an MCP from source."""
+def _install_marker(mcp_name: str, source: str) -> Path:
+    """Marker file recording a successful install of *source*."""
+    key = hashlib.blake2b(f"{mcp_name}:{source}".encode(), digest_size=16)
+    return INSTALL_MARKER_DIR / key.hexdigest()
+
+
+def install_mcp(mcp_name: str, source: str, *, force: bool = False) -> bool:
+    """Install an MCP from source.
+
+    An install that succeeded within the last week is not repeated unless
+    *force* is set.
+    """
+    marker = _install_marker(mcp_name, source)
+    if not force:
+        try:
+            if time.time() - marker.stat().st_mtime < _INSTALL_MARKER_MAX_AGE:
+                logger.debug("MCP %s already installed from %s", mcp_name, source)
+                return True
+        except FileNotFoundError:
+            pass
+
     if "github.com" in source or "/" in source:
         cmd = f"npx -y @anthropic-ai/mcp-installer install {source}"
     else:
@@ -175,10 +312,16 @@ def install_mcp(mcp_name: str, source: str) -> bool:
 
     try:
         subprocess.run(cmd, shell=True, check=True)
-        return True
     except subprocess.CalledProcessError:
         return False
 
+    try:
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:
+        logger.debug("Could not write install marker %s", marker, exc_info=True)
+    return True
+
 
 # ---------------------------------------------------------------------------
 # Claude-powered MCP catalog discovery
@@ -205,21 +348,15 @@ def search_mcp_catalog(need: str, *, run_cmd=None) -> dict | None:
     """
     from core.claude_helper import call_claude_json
 
-    # Build combined catalog from both sources.
-    catalog_parts: list[str] = []
-    if MCP_CATALOG.exists():
-        catalog_parts.append(MCP_CATALOG.read_text())
-    if RAGGABLE_CATALOG.exists():
-        catalog_parts.append(RAGGABLE_CATALOG.read_text())
-
-    if not catalog_parts:
+    # The catalog text is assembled once per catalog change; each query
+    # only adds its own short header in front of it.
+    catalog_section = _catalog_section()
+    if catalog_section is None:
         logger.warning(
             "No MCP catalogs found at %s or %s", MCP_CATALOG, RAGGABLE_CATALOG
         )
         return None
 
-    catalog_text = "\n\n".join(catalog_parts)
-
     prompt = (
         "You are an MCP server expert. The user needs an MCP server for:\n\n"
         f'  "{need}"\n\n'
@@ -231,8 +368,7 @@ def search_mcp_catalog(need: str, *, run_cmd=None) -> dict | None:
         '"key_name": "ENV_VAR name if needed", '
         '"key_instructions": "1-2 sentence instructions for getting the key"}\n'
         'If no good match exists, reply: {"name": null}\n\n'
-        "--- CATALOG ---\n"
-        f"{catalog_text}"
+        f"{catalog_section}"
     )
 
     result = call_claude_json(prompt, run_cmd=run_cmd)
@@ -282,7 +418,8 @@ def suggest_and_install_mcp(
 
     Args:
         need: What the user needs (natural language).
-        auto_install: If True, install without asking. If False, ask first.
+        auto_install: If True, install without asking. If False, ask first,
+            and do not install when there is no *prompt_fn* to ask with.
         prompt_fn: Callable(question, default) for user input.
         print_fn: Callable(message) for output.
         run_cmd: Optional callable for testing subprocess calls.
@@ -290,6 +427,10 @@ def suggest_and_install_mcp(
     Returns:
         True if an MCP was installed, False otherwise.
     """
+    if not auto_install and prompt_fn is None and print_fn is None:
+        # Nothing would be shown or installed; skip the Claude round trip
+        return False
+
     _print = print_fn or (lambda msg: None)
     _prompt = prompt_fn
 
@@ -325,7 +466,9 @@ def suggest_and_install_mcp(
     if not install_cmd:
         return False
 
-    if not auto_install and _prompt:
+    if not auto_install:
+        if not _prompt:
+            return False
         confirm = _prompt(f"Install {name}? (yes/no)", "yes")
         if confirm.lower() not in ("yes", "y"):
             return False
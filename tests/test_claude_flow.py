@@ -176,6 +176,16 @@ class TestMemory:
             call_args = mock.call_args[0][0]
             assert "--tags" in call_args
 
+    def test_store_memory_batch(self, bridge):
+        with patch("core.claude_flow.subprocess.run") as mock:
+            mock.return_value = _mock_run(stdout='{"id": "mem-789"}')
+            results = bridge.store_memory_batch(
+                ["first entry", "second entry"],
+                metadata={"section": "Tricks"},
+            )
+            assert [r["id"] for r in results] == ["mem-789", "mem-789"]
+            assert mock.call_count == 2
+
 
 class TestSecurity:
     def test_scan_security(self, bridge):
@@ -1,6 +1,7 @@
 """Tests for cross-repository coordination."""
 
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from core.cross_repo import (
     LinkedRepo,
@@ -182,6 +183,24 @@ def test_search_all_linked(tmp_path: Path, monkeypatch):
     assert "machine learning" in results[0]["text"].lower()
 
 
+def test_search_all_linked_hnsw_queries_each_repo(tmp_path: Path):
+    repos_file = tmp_path / "linked.json"
+    link_repository("alpha", str(tmp_path / "alpha"), repos_file=repos_file)
+    link_repository("beta", str(tmp_path / "beta"), repos_file=repos_file)
+
+    def query_memory(query, *, top_k, namespace):
+        score = 0.9 if namespace == "linked-beta" else 0.5
+        return {"results": [{"text": f"{namespace} hit", "score": score}]}
+
+    bridge = MagicMock()
+    bridge.query_memory.side_effect = query_memory
+    with patch("core.cross_repo._get_bridge", return_value=bridge):
+        results = search_all_linked("anything", repos_file=repos_file)
+
+    assert [r["source"] for r in results] == ["beta", "alpha"]
+    assert bridge.query_memory.call_count == 2
+
+
 def test_reindex_all(tmp_path: Path):
     """Test reindexing all linked repos."""
     repos_file = tmp_path / "linked.json"
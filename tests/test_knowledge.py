@@ -1,21 +1,47 @@
 """Tests for the knowledge/encyclopedia system."""
 
+import io
+import json
+import re
+from contextlib import nullcontext
 from pathlib import Path
 
+import pytest
+
+from core.claude_flow import ClaudeFlowUnavailable
 from core.knowledge import (
+    _QUERY_CACHE,
+    _iter_rule_blocks,
     _normalize,
     _resolve_section_type,
     append_learning,
+    append_learnings,
     discover_sections,
+    export_knowledge,
     find_section,
+    flush_hnsw_queue,
     get_encyclopedia_stats,
+    import_knowledge,
     log_decision,
     log_failure,
     log_success,
     log_trick,
     search_knowledge,
+    sync_learnings_to_project,
+    sync_many_to_shared,
+    sync_to_shared,
 )
 
+
+@pytest.fixture(autouse=True)
+def _drain_hnsw_queue():
+    """Keep background vector-memory writes from leaking into other tests."""
+    yield
+    _QUERY_CACHE.clear()
+    with patch("core.knowledge._get_bridge", side_effect=ClaudeFlowUnavailable("x")):
+        flush_hnsw_queue()
+
+
 TEMPLATE = """# Project Encyclopedia
 
 ## Tricks
@@ -42,6 +68,46 @@ def test_append_learning(tmp_path: Path):
     assert "## Tricks" in content
 
 
+def test_append_learning_writes_atomically(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE)
+    enc.chmod(0o640)
+
+    append_learning("Tricks", "Atomic entry", encyclopedia_path=enc)
+    assert "Atomic entry" in enc.read_text()
+    assert (enc.stat().st_mode & 0o777) == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["ENCYCLOPEDIA.md"]
+
+
+def test_append_learning_at_end_of_file_appends_in_place(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE)
+    inode = enc.stat().st_ino
+
+    append_learning("What Doesn't Work", "Tail entry", encyclopedia_path=enc)
+    content = enc.read_text()
+    assert content.startswith(TEMPLATE)
+    assert content.endswith(" Tail entry")
+    assert enc.stat().st_ino == inode
+
+
+def test_append_learning_resolves_user_id_once(tmp_path: Path):
+    import core.knowledge as knowledge
+
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE)
+    get_user_id = MagicMock(return_value="alice@example.org")
+    knowledge._cached_user_id.cache_clear()
+    try:
+        with patch.object(knowledge, "_get_user_id", get_user_id):
+            append_learning("Tricks", "First", encyclopedia_path=enc)
+            append_learning("Tricks", "Second", encyclopedia_path=enc)
+    finally:
+        knowledge._cached_user_id.cache_clear()
+    assert get_user_id.call_count == 1
+    assert enc.read_text().count("(alice@example.org)") == 2
+
+
 def test_append_learning_multiple(tmp_path: Path):
     enc = tmp_path / "ENCYCLOPEDIA.md"
     enc.write_text(TEMPLATE)
@@ -53,6 +119,24 @@ def test_append_learning_multiple(tmp_path: Path):
     assert "Trick 2" in content
 
 
+def test_append_learnings_batch(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE)
+
+    append_learnings("tips", ["Batch 1", "Batch 2"], encyclopedia_path=enc)
+    content = enc.read_text()
+    tricks_idx = content.index("## Tricks")
+    decisions_idx = content.index("## Decisions")
+    assert tricks_idx < content.index("Batch 2") < content.index("Batch 1")
+    assert content.index("Batch 1") < decisions_idx
+
+
+def test_append_learnings_empty_is_noop(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    append_learnings("Tricks", [], encyclopedia_path=enc)
+    assert not enc.exists()
+
+
 def test_log_decision(tmp_path: Path):
     enc = tmp_path / "ENCYCLOPEDIA.md"
     enc.write_text(TEMPLATE)
@@ -105,6 +189,34 @@ def test_search_knowledge(tmp_path: Path):
     assert any("batch size" in r.lower() for r in results)
 
 
+def test_search_knowledge_sees_file_changes(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE)
+    assert search_knowledge("gradient clipping", encyclopedia_path=enc) == []
+
+    append_learning("Tricks", "Use gradient clipping", encyclopedia_path=enc)
+    results = search_knowledge("gradient clipping", encyclopedia_path=enc)
+    assert any("Use gradient clipping" in r for r in results)
+
+
+def test_search_knowledge_splits_like_splitlines(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text("- alpha note\x0c- beta note\n- alpha again\n")
+    results = search_knowledge("alpha", encyclopedia_path=enc)
+    assert results == ["- alpha note", "- alpha again"]
+
+
+def test_search_knowledge_non_ascii_query(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE + "\n- [2024-01-01] Cafe notes\n")
+    assert search_knowledge("Café", encyclopedia_path=enc) == []
+
+    enc.write_text(TEMPLATE + "\n- [2024-01-01] CAFÉ notes\n")
+    assert search_knowledge("café", encyclopedia_path=enc) == [
+        "- [2024-01-01] CAFÉ notes"
+    ]
+
+
 def test_search_knowledge_no_match(tmp_path: Path):
     enc = tmp_path / "ENCYCLOPEDIA.md"
     enc.write_text(TEMPLATE)
@@ -126,9 +238,10 @@ def test_append_learning_dual_writes(tmp_path: Path):
     with patch("core.knowledge._get_bridge", return_value=mock_bridge):
         append_learning("Tricks", "Use GPU for speed", encyclopedia_path=enc)
         assert "Use GPU for speed" in enc.read_text()
-        mock_bridge.store_memory.assert_called_once()
-        call_kwargs = mock_bridge.store_memory.call_args
-        assert call_kwargs[0][0] == "Use GPU for speed"
+        flush_hnsw_queue()
+        mock_bridge.store_memory_batch.assert_called_once()
+        call_kwargs = mock_bridge.store_memory_batch.call_args
+        assert call_kwargs[0][0] == ["Use GPU for speed"]
         assert call_kwargs[1]["namespace"] == "knowledge"
 
 
@@ -171,6 +284,53 @@ def test_search_knowledge_merges_semantic_and_keyword(tmp_path: Path):
         assert any("batch size 32" in r for r in results)
 
 
+def test_search_knowledge_merge_order_and_dedup(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE + "\n- shared batch hit\n- local batch hit\n")
+    mock_bridge = MagicMock()
+    mock_bridge.query_memory.return_value = {
+        "results": [{"text": "- shared batch hit"}, {"text": "- shared batch hit"}]
+    }
+    linked = [
+        {"text": "- local batch hit", "source": "other"},
+        {"text": "remote batch hit", "source": "other"},
+        {"text": "remote batch hit", "source": "other"},
+    ]
+    with (
+        patch("core.knowledge._get_bridge", return_value=mock_bridge),
+        patch("core.knowledge._search_all_linked", return_value=linked),
+    ):
+        results = search_knowledge("batch", encyclopedia_path=enc)
+    assert results == [
+        "- shared batch hit",
+        "- local batch hit",
+        "[other] remote batch hit",
+    ]
+
+
+def test_search_knowledge_caches_repeated_queries(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE + "\n- [2024-01-01] cached batch hit\n")
+    mock_bridge = MagicMock()
+    mock_bridge.query_memory.return_value = {"results": []}
+    with patch("core.knowledge._get_bridge", return_value=mock_bridge):
+        first = search_knowledge("batch", encyclopedia_path=enc)
+        first.append("caller mutation")
+        assert search_knowledge("batch", encyclopedia_path=enc) == first[:-1]
+        assert mock_bridge.query_memory.call_count == 1
+
+        # Any write to the encyclopedia invalidates the cached result
+        append_learning("Tricks", "Second batch note", encyclopedia_path=enc)
+        results = search_knowledge("batch", encyclopedia_path=enc)
+        assert any("Second batch note" in r for r in results)
+        assert mock_bridge.query_memory.call_count == 2
+
+        # Entries expire so remote backends are eventually re-queried
+        with patch("core.knowledge._QUERY_CACHE_TTL", 0.0):
+            search_knowledge("batch", encyclopedia_path=enc)
+        assert mock_bridge.query_memory.call_count == 3
+
+
 def test_search_knowledge_bridge_unavailable_keyword_only(tmp_path: Path):
     enc = tmp_path / "ENCYCLOPEDIA.md"
     enc.write_text(TEMPLATE + "\n- [2024-01-01] keyword match here\n")
@@ -316,6 +476,24 @@ class TestGetEncyclopediaStatsFuzzy:
         assert stats["Tricks"] == 2
         assert stats["Decisions"] == 0
 
+    def test_counts_every_section_in_one_pass(self, tmp_path: Path):
+        enc = tmp_path / "ENCYCLOPEDIA.md"
+        enc.write_text(
+            TEMPLATE.replace("## Decisions", "## Design Choices")
+            .replace(
+                "<!-- Learnings get appended here -->",
+                "- [2024-01-01] t1\n- [2024-01-02] t2\nnot a bullet",
+            )
+            .replace("<!-- Successful approaches -->", "  - [2024-01-03] w1")
+        )
+        stats = get_encyclopedia_stats(enc)
+        assert stats == {
+            "Tricks": 2,
+            "Decisions": 0,
+            "What Works": 1,
+            "What Doesn't Work": 0,
+        }
+
     def test_drifted_headers(self, tmp_path: Path):
         enc = tmp_path / "ENCYCLOPEDIA.md"
         drifted = TEMPLATE.replace("## Tricks", "## Tips and Tricks")
@@ -323,3 +501,195 @@ class TestGetEncyclopediaStatsFuzzy:
         append_learning("tips", "Trick A", encyclopedia_path=enc)
         stats = get_encyclopedia_stats(enc)
         assert stats["Tricks"] == 1
+
+
+class TestSyncLearningsToProject:
+    def _make_project(self, root: Path, encyclopedia: str) -> Path:
+        (root / "knowledge").mkdir(parents=True)
+        (root / "knowledge" / "ENCYCLOPEDIA.md").write_text(encyclopedia)
+        return root
+
+    def test_transfers_only_new_entries(self, tmp_path: Path):
+        src = self._make_project(
+            tmp_path / "src",
+            TEMPLATE
+            + "\n- [2024-01-01 10:00] Shared trick\n- [2024-01-02 10:00] Fresh trick\n",
+        )
+        tgt = self._make_project(
+            tmp_path / "tgt",
+            TEMPLATE + "\n- [2024-03-03 09:00] (alice) Shared trick\n",
+        )
+        result = sync_learnings_to_project(src, tgt)
+        assert result["encyclopedia_transferred"] == 1
+        content = (tgt / "knowledge" / "ENCYCLOPEDIA.md").read_text()
+        assert "Fresh trick" in content
+        assert content.count("Shared trick") == 1
+
+    def test_repeated_source_entries_transfer_once(self, tmp_path: Path):
+        src = self._make_project(
+            tmp_path / "src",
+            TEMPLATE
+            + "\n- [2024-01-01 10:00] Same idea\n- [2024-05-01 10:00] Same idea\n",
+        )
+        tgt = self._make_project(tmp_path / "tgt", TEMPLATE)
+        result = sync_learnings_to_project(src, tgt)
+        assert result["encyclopedia_transferred"] == 1
+
+    def test_transfers_only_new_cheatsheet_rules(self, tmp_path: Path):
+        src = self._make_project(tmp_path / "src", TEMPLATE)
+        tgt = self._make_project(tmp_path / "tgt", TEMPLATE)
+        (src / "knowledge" / "CHEATSHEET.md").write_text(
+            "# Cheatsheet\n## Pin seeds\nAlways set seeds.\n---\nLog configs\n"
+        )
+        (tgt / "knowledge" / "CHEATSHEET.md").write_text(
+            "# Cheatsheet\n## Pin seeds\nAlready known.\n"
+        )
+        result = sync_learnings_to_project(src, tgt)
+        assert result["rules_transferred"] == 1
+        assert "Log configs" in (tgt / "knowledge" / "CHEATSHEET.md").read_text()
+
+        # A second sync finds nothing new
+        assert sync_learnings_to_project(src, tgt)["rules_transferred"] == 0
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "## Only header\nbody\n",
+        "intro\n## A\nrule a\n---\nrule b\n",
+        "x\n---\n## not split\n---\n---\ny",
+        "a\n---  \nb\n---",
+    ],
+)
+def test_iter_rule_blocks_matches_regex_split(text: str):
+    expected = re.split(r"\n---\n|\n## ", text)
+    assert list(_iter_rule_blocks(io.StringIO(text))) == expected
+
+
+class TestImportKnowledgeMerge:
+    def test_merge_matches_repeated_single_appends(self, tmp_path: Path):
+        enc = tmp_path / "ENCYCLOPEDIA.md"
+        enc.write_text(TEMPLATE + "\n- [2024-01-01 10:00] Already here\n")
+        export = tmp_path / "export.json"
+        export.write_text(
+            json.dumps(
+                {
+                    "content": "## Tricks\n"
+                    "- [2024-01-01 10:00] Already here\n"
+                    "- [2024-02-01 10:00] First new\n"
+                    "- [2024-02-02 10:00] Second new\n"
+                }
+            )
+        )
+        mock_bridge = MagicMock()
+        with patch("core.knowledge._get_bridge", return_value=mock_bridge):
+            count = import_knowledge(export, encyclopedia_path=enc)
+            flush_hnsw_queue()
+
+        assert count == 2
+        content = enc.read_text()
+        # Newest entries sit at the top of the section, as with append_learning
+        assert content.index("Second new") < content.index("First new")
+        assert content.count("Already here") == 1
+        mock_bridge.store_memory_batch.assert_called_once()
+
+
+def test_sync_many_to_shared(tmp_path: Path):
+    projects = []
+    for name in ("alpha", "beta", "gamma"):
+        enc = tmp_path / name / "ENCYCLOPEDIA.md"
+        enc.parent.mkdir()
+        enc.write_text(TEMPLATE + f"\n- [2024-01-01] {name} trick\n")
+        projects.append((name, enc))
+    shared = tmp_path / "shared"
+
+    sync_many_to_shared(projects, shared)
+
+    for name, enc in projects:
+        assert (shared / f"{name}.md").read_text() == enc.read_text()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_export_import_roundtrip(tmp_path: Path, use_orjson: bool):
+    import core.knowledge as knowledge
+
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE + "\n- [2024-01-01 10:00] Exported trick\n")
+    patcher = nullcontext() if use_orjson else patch.object(knowledge, "orjson", None)
+    with patcher:
+        out = export_knowledge("demo", encyclopedia_path=enc)
+        data = json.loads(out.read_text())
+        assert data["project"] == "demo"
+        assert data["content"] == enc.read_text()
+
+        restored = tmp_path / "restored" / "ENCYCLOPEDIA.md"
+        count = import_knowledge(out, encyclopedia_path=restored, merge=False)
+    assert count == 1
+    assert restored.read_text() == enc.read_text()
+
+
+def test_failed_export_keeps_previous_file(tmp_path: Path):
+    import core.knowledge as knowledge
+
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE)
+    out = tmp_path / "export.json"
+    out.write_text("previous export")
+    with (
+        patch.object(knowledge, "orjson", None),
+        patch("core.knowledge.json.dump", side_effect=ValueError("boom")),
+        pytest.raises(ValueError),
+    ):
+        export_knowledge("demo", encyclopedia_path=enc, output_path=out)
+    assert out.read_text() == "previous export"
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "ENCYCLOPEDIA.md",
+        "export.json",
+    ]
+
+
+def test_missing_encyclopedia_is_handled(tmp_path: Path):
+    enc = tmp_path / "missing" / "ENCYCLOPEDIA.md"
+    assert search_knowledge("anything", encyclopedia_path=enc) == []
+    assert get_encyclopedia_stats(encyclopedia_path=enc) == {}
+    with pytest.raises(FileNotFoundError, match="Encyclopedia not found"):
+        export_knowledge("demo", encyclopedia_path=enc)
+    with pytest.raises(FileNotFoundError, match="Import file not found"):
+        import_knowledge(tmp_path / "nope.json", encyclopedia_path=enc)
+
+    shared = tmp_path / "shared"
+    sync_to_shared("demo", encyclopedia_path=enc, shared_path=shared)
+    assert shared.is_dir() and not any(shared.iterdir())
+
+    tgt = tmp_path / "tgt"
+    (tgt / "knowledge").mkdir(parents=True)
+    assert sync_learnings_to_project(tmp_path / "src", tgt) == {
+        "encyclopedia_transferred": 0,
+        "rules_transferred": 0,
+    }
+
+
+def test_export_does_not_query_search_backends(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE)
+    mock_bridge = MagicMock()
+    with patch("core.knowledge._get_bridge", return_value=mock_bridge):
+        export_knowledge("demo", encyclopedia_path=enc)
+    mock_bridge.query_memory.assert_not_called()
+
+
+def test_hnsw_queue_batches_entries(tmp_path: Path):
+    enc = tmp_path / "ENCYCLOPEDIA.md"
+    enc.write_text(TEMPLATE)
+    mock_bridge = MagicMock()
+    with patch("core.knowledge._get_bridge", return_value=mock_bridge):
+        for i in range(5):
+            append_learning("Tricks", f"Queued {i}", encyclopedia_path=enc)
+        flush_hnsw_queue()
+    stored = [
+        text
+        for call in mock_bridge.store_memory_batch.call_args_list
+        for text in call[0][0]
+    ]
+    assert stored == [f"Queued {i}" for i in range(5)]
@@ -0,0 +1,177 @@
+"""Tests for adaptive LaTeX scaffold generation."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from core.latex_scaffold import (
+    TEMPLATES_DIR,
+    Section,
+    _domain_of_text,
+    _generate_main_tex,
+    _generate_preamble_extra,
+    _generator_cache_clear,
+    _score_domains,
+    detect_domain,
+    generate_latex_scaffold,
+    get_section_structure,
+    scaffold_from_config,
+    select_packages,
+)
+
+GOAL_TEXT = (
+    "We train a deep learning model for image generation and object "
+    "detection, comparing a CNN baseline against a diffusion model."
+)
+
+
+def test_detect_domain_from_goal_text():
+    assert detect_domain(GOAL_TEXT) == "cv"
+
+
+def test_detect_domain_explicit_project_type_wins():
+    assert detect_domain(GOAL_TEXT, project_type="biology") == "biology"
+
+
+@pytest.mark.parametrize("text", ["", "An unrelated note about gardening."])
+def test_detect_domain_defaults_to_general(text: str):
+    assert detect_domain(text) == "general"
+
+
+def test_score_domains_without_automaton():
+    with patch("core.latex_scaffold._AC", None):
+        scores = _score_domains(GOAL_TEXT.lower())
+    # "image" and "image generation" both count, as do overlapping hits
+    assert scores["cv"] == 6
+    assert scores["ml"] == 1
+
+
+def test_detect_domain_weighs_keyword_frequency():
+    text = "Protein binding: each protein and protein complex, via deep learning."
+    assert detect_domain(text) == "biology"
+
+
+def test_detect_domain_ties_go_to_first_listed_domain():
+    assert detect_domain("A gradient step over the corpus.") == "ml"
+
+
+def test_score_domains_automaton_matches_fallback():
+    pytest.importorskip("ahocorasick_rs")
+    text = (GOAL_TEXT + " seq2seqseq2seq image image").lower()
+    with patch("core.latex_scaffold._AC", None):
+        expected = _score_domains(text)
+    assert _score_domains(text) == expected
+
+
+def test_detect_domain_memoizes_repeated_text():
+    _domain_of_text.cache_clear()
+    text = "Protein folding and gene expression in tissue samples."
+    with patch(
+        "core.latex_scaffold._score_domains", wraps=_score_domains
+    ) as score_domains:
+        assert detect_domain(text) == "biology"
+        assert detect_domain(text, project_type="general") == "biology"
+        # An explicit domain short-circuits without scanning or caching
+        assert detect_domain(text, project_type="physics") == "physics"
+    assert score_domains.call_count == 1
+    assert _domain_of_text.cache_info().currsize == 1
+
+
+def test_select_packages_skips_base_and_duplicate_packages():
+    extras = select_packages("review-paper", "biology")
+    names = [name for name, _, _ in extras]
+    # longtable/pdflscape come from both tables but are listed once
+    assert names == [
+        "siunitx",
+        "mhchem",
+        "textgreek",
+        "longtable",
+        "pdflscape",
+        "forest",
+    ]
+    assert select_packages("review-paper", "biology") is extras
+    assert select_packages("unknown", "unknown") == ()
+    assert select_packages("technical-report", "unknown")[0][0] == "fancyhdr"
+
+
+def test_section_structure_is_shared_and_immutable():
+    sections = get_section_structure("journal-article", "nlp")
+    # NLP falls back to the ML structure, resolved once at import
+    assert sections is get_section_structure("journal-article", "ml")
+    assert sections[0] == Section(
+        level="section",
+        title="Introduction",
+        label="sec:introduction",
+        guidance="Motivate the problem, state contributions, and outline the paper.",
+    )
+    with pytest.raises(AttributeError):
+        sections[0].title = "Changed"
+
+
+def test_section_structure_fallbacks():
+    general = get_section_structure("journal-article", "general")
+    assert get_section_structure("unknown-type", "ml") is general
+    assert get_section_structure("conference-paper", "unknown") is (
+        get_section_structure("conference-paper", "general")
+    )
+
+
+def test_generate_latex_scaffold_copies_templates(tmp_path: Path):
+    created = generate_latex_scaffold(tmp_path, "journal-article", "ml")
+    assert {"main.tex", "preamble.tex", "preamble_extra.tex", "journals/"} <= set(
+        created
+    )
+    assert (tmp_path / "preamble.tex").read_text() == (
+        TEMPLATES_DIR / "preamble.tex"
+    ).read_text()
+    assert "\\section{Introduction}" in (tmp_path / "main.tex").read_text()
+
+    # Existing files are kept unless overwrite is requested
+    assert generate_latex_scaffold(tmp_path, "journal-article", "ml") == {}
+
+
+def test_generators_are_memoized():
+    _generator_cache_clear()
+    main_tex = _generate_main_tex("conference-paper", "nlp")
+    assert _generate_main_tex("conference-paper", "nlp") is main_tex
+    assert _generate_main_tex.cache_info().hits == 1
+
+    with patch(
+        "core.latex_scaffold.select_packages",
+        return_value=(("patched", "", "Patched package"),),
+    ):
+        _generator_cache_clear()
+        assert "\\usepackage{patched}" in _generate_preamble_extra(
+            "thesis-chapter", "ml"
+        )
+    _generator_cache_clear()
+    assert "patched" not in _generate_preamble_extra("thesis-chapter", "ml")
+
+
+def test_generate_latex_scaffold_falls_back_to_copy2(tmp_path: Path):
+    with patch("os.copy_file_range", side_effect=OSError, create=True):
+        created = generate_latex_scaffold(tmp_path, "technical-report", "physics")
+    assert "Makefile" in created
+    assert (tmp_path / "Makefile").read_bytes() == (
+        TEMPLATES_DIR / "Makefile"
+    ).read_bytes()
+
+
+def test_scaffold_from_config_skips_complete_scaffold(tmp_path: Path):
+    goal = tmp_path / "knowledge" / "GOAL.md"
+    goal.parent.mkdir()
+    goal.write_text("Protein folding in tissue samples.")
+    created = scaffold_from_config(tmp_path, "journal-article")
+    assert "supplementary.tex" in created
+
+    with patch("core.latex_scaffold.detect_domain") as detect:
+        assert scaffold_from_config(tmp_path, "journal-article") == {}
+    detect.assert_not_called()
+
+    # A missing output is regenerated, and overwrite always regenerates
+    (tmp_path / "paper" / "main.tex").unlink()
+    assert list(scaffold_from_config(tmp_path, "journal-article")) == ["main.tex"]
+    assert "main.tex" in scaffold_from_config(
+        tmp_path, "journal-article", overwrite=True
+    )
@@ -90,6 +90,31 @@ class TestGetNeededMCPs:
         needed = loader_with_mcps.get_needed_mcps("Browse the WEB page")
         assert "browser" in needed
 
+    def test_shared_keyword_matches_all_owners_in_order(self, loader_with_mcps):
+        loader_with_mcps.register_mcp("notes", {}, tier=2, trigger_keywords=["File"])
+        needed = loader_with_mcps.get_needed_mcps("save the file")
+        assert needed == ["filesystem", "notes"]
+
+    def test_reregister_replaces_keywords(self, loader_with_mcps):
+        loader_with_mcps.register_mcp("github", {}, tier=2, trigger_keywords=["git"])
+        assert loader_with_mcps.get_needed_mcps("open a pull request") == []
+        assert loader_with_mcps.get_needed_mcps("git log") == ["github"]
+
+    def test_matches_are_cached_per_task(self, loader_with_mcps):
+        task = "Recall what we read"
+        needed = loader_with_mcps.get_needed_mcps(task)
+        assert needed == ["filesystem", "memory"]
+        # optimize_context reuses the cached match for the same task
+        loader_with_mcps._kw_to_mcps.clear()
+        assert loader_with_mcps.optimize_context(["filesystem", "github"], task) == [
+            "github"
+        ]
+
+    def test_register_invalidates_cached_matches(self, loader_with_mcps):
+        assert loader_with_mcps.get_needed_mcps("plot a chart") == []
+        loader_with_mcps.register_mcp("plots", {}, tier=2, trigger_keywords=["plot"])
+        assert loader_with_mcps.get_needed_mcps("plot a chart") == ["plots"]
+
 
 # ── Loading / unloading lifecycle ───────────────────────────────────
 
@@ -151,6 +176,13 @@ class TestOptimizeContext:
             fs_idx = to_unload.index("filesystem") if "filesystem" in to_unload else 999
             assert browser_idx < fs_idx
 
+    def test_duplicate_active_names_suggested_once(self, loader_with_mcps):
+        to_unload = loader_with_mcps.optimize_context(
+            active_mcps=["browser", "filesystem", "browser"],
+            current_task="nothing relevant",
+        )
+        assert to_unload == ["browser", "filesystem"]
+
 
 # ── Context cost estimation ─────────────────────────────────────────
 
@@ -165,3 +197,15 @@ class TestEstimateContextCost:
         # Unknown MCPs should contribute zero cost, not raise
         cost = loader_with_mcps.estimate_context_cost(["nonexistent"])
         assert cost == 0
+
+    def test_cost_follows_tier(self, loader_with_mcps):
+        loader_with_mcps.register_mcp("odd", {}, tier=7, trigger_keywords=[])
+        cost = loader_with_mcps.estimate_context_cost(
+            ["filesystem", "github", "browser", "odd", "nonexistent"]
+        )
+        # 800 + 1200 + 1800 by tier, plus the fallback for an unknown tier
+        assert cost == 4800
+
+    def test_duplicate_names_counted_once(self, loader_with_mcps):
+        cost = loader_with_mcps.estimate_context_cost(["github", "github"])
+        assert cost == loader_with_mcps.estimate_context_cost(["github"])
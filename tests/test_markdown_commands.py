@@ -1,11 +1,16 @@
 """Tests for markdown-to-commands module."""
 
 from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from core.markdown_commands import (
+    _simple_argv,
     execute_runbook,
     extract_code_blocks,
     generate_task_file,
+    iter_code_blocks,
     parse_runbook,
     parse_todo_to_tasks,
     update_todo_status,
@@ -40,6 +45,39 @@ def test_extract_code_blocks_no_language():
     assert blocks[0]["code"] == "plain code"
 
 
+def test_unclosed_fence_before_blank_lines_scans_linearly(tmp_path: Path):
+    # Backtracking over the blank lines made this quadratic (minutes here)
+    md = "# Step\n```bash" + "\n" * 200_000 + "echo never closed\n"
+    assert extract_code_blocks(md) == []
+    rb = tmp_path / "runbook.md"
+    rb.write_text(md)
+    assert parse_runbook(rb) == []
+
+
+@pytest.mark.parametrize(
+    "md",
+    [
+        "```bash\n\n  \n  echo hi\n```\ntext\n```\n```\n",
+        "```py\r\nx = 1\r\n```python\ny\n```\n",
+        "```a b\nnot a block\n````\n```\nlast\n``` trailing",
+        "```sh\nunterminated\n",
+    ],
+)
+def test_iter_code_blocks_matches_extract_code_blocks(md: str):
+    lines = md.splitlines(keepends=True)
+    assert list(iter_code_blocks(lines)) == extract_code_blocks(md)
+
+
+def test_iter_code_blocks_streams_file(tmp_path: Path):
+    md = tmp_path / "runbook.md"
+    md.write_text("# Run\n\n```bash\necho one\n```\n\n```python\nx = 2\n```\n")
+    with md.open() as f:
+        blocks = iter_code_blocks(f)
+        first = next(blocks)
+        assert first == {"language": "bash", "code": "echo one", "start": 7}
+        assert [b["code"] for b in blocks] == ["x = 2"]
+
+
 # ---------------------------------------------------------------------------
 # parse_todo_to_tasks
 # ---------------------------------------------------------------------------
@@ -91,6 +129,29 @@ def test_parse_runbook(tmp_path: Path):
     assert steps[1]["language"] == "python"
 
 
+def test_parse_runbook_tracks_nearest_heading(tmp_path: Path):
+    rb = tmp_path / "runbook.md"
+    rb.write_text(
+        "```bash\necho intro\n```\n\n"
+        "# Setup\n\n```bash\necho one\n```\n\n```bash\necho two\n```\n\n"
+        "## Empty\n\n### Build\n\n```python\nx = 1\n```\n"
+    )
+    steps = parse_runbook(rb)
+    assert [s["heading"] for s in steps] == ["", "Setup", "Setup", "Build"]
+
+
+def test_parse_runbook_ignores_comments_inside_blocks(tmp_path: Path):
+    rb = tmp_path / "runbook.md"
+    rb.write_text(
+        "## Install\n\n```bash\n# fetch deps\npip install .\n```\n\n"
+        "```sh\nmake\n```\n"
+    )
+    steps = parse_runbook(rb)
+    assert [s["heading"] for s in steps] == ["Install", "Install"]
+    assert steps[0]["code"] == "# fetch deps\npip install ."
+    assert steps[1]["language"] == "sh"
+
+
 def test_execute_runbook_dry_run():
     steps = [
         {"language": "bash", "code": "echo hello", "heading": "greet"},
@@ -110,6 +171,60 @@ def test_execute_runbook_real_bash():
     assert "ok" in results[0]["output"]
 
 
+def test_execute_runbook_shell_syntax_and_builtins():
+    steps = [
+        {"language": "sh", "code": "echo one | tr o 0", "heading": "pipe"},
+        {"language": "bash", "code": "cd / && pwd", "heading": "builtin"},
+        {"language": "bash", "code": "no-such-command-xyz", "heading": "missing"},
+    ]
+    results = execute_runbook(steps, dry_run=False)
+    assert [r["output"] for r in results[:2]] == ["0ne", "/"]
+    assert results[2]["returncode"] == 127
+
+
+@pytest.mark.parametrize(
+    "code, argv",
+    [
+        ("echo  hi there", ["echo", "hi", "there"]),
+        ("echo hi | cat", None),
+        ("echo $HOME", None),
+        ("echo 'a b'", None),
+        ("FOO=1 env", None),
+        ("echo hi # note", None),
+        ("echo one\necho two", None),
+        ("cd /tmp", None),
+        ("", None),
+    ],
+)
+def test_simple_argv(code: str, argv):
+    assert _simple_argv(code) == argv
+
+
+def test_execute_runbook_runs_simple_commands_without_shell():
+    steps = [{"language": "bash", "code": "echo hi", "heading": "greet"}]
+    with patch("core.markdown_commands.subprocess.run") as run:
+        run.return_value.stdout = "hi\n"
+        run.return_value.returncode = 0
+        execute_runbook(steps, dry_run=False)
+    args, kwargs = run.call_args
+    assert args[0] == ["echo", "hi"]
+    assert kwargs["shell"] is False
+
+
+def test_execute_runbook_parallel_keeps_step_order():
+    steps = [
+        {"language": "bash", "code": f"sleep 0.{3 - i}; echo {i}", "heading": str(i)}
+        for i in range(3)
+    ]
+    steps.append({"language": "ruby", "code": "puts 1"})
+    results = execute_runbook(steps, dry_run=False, parallel=4)
+    assert [r["output"] for r in results[:3]] == ["0", "1", "2"]
+    assert results[3]["skipped"] is True
+    assert execute_runbook(steps, dry_run=True, parallel=4) == execute_runbook(
+        steps, dry_run=True
+    )
+
+
 # ---------------------------------------------------------------------------
 # update_todo_status
 # ---------------------------------------------------------------------------
@@ -126,6 +241,25 @@ def test_update_todo_status(tmp_path: Path):
     assert "- [ ] Second" in text  # unchanged
 
 
+def test_update_todo_status_patches_only_the_checkbox(tmp_path: Path):
+    todo = tmp_path / "TODO.md"
+    original = "# Tâches\r\n\r\n- [ ] Écrire\r\n- [x] (**P1**) Relire ✓\r\n".encode()
+    todo.write_bytes(original)
+    update_todo_status(todo, 1, False)
+    update_todo_status(todo, 0, True)
+    assert todo.read_bytes() == original.replace(b"[ ]", b"[x]").replace(
+        b"[x] (**P1**)", b"[ ] (**P1**)"
+    )
+
+
+def test_update_todo_status_out_of_range(tmp_path: Path):
+    todo = tmp_path / "TODO.md"
+    todo.write_text("- [ ] One\n- [ ] Two\n")
+    for idx in (2, -1):
+        with pytest.raises(IndexError, match="found 2 tasks"):
+            update_todo_status(todo, idx, True)
+
+
 # ---------------------------------------------------------------------------
 # generate_task_file
 # ---------------------------------------------------------------------------
@@ -1,11 +1,25 @@
 """Tests for MCP auto-discovery and classification."""
 
+import json
+import os
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
 from core.mcps import (
+    _catalog_section,
+    _lazy_loader,
+    _npx_package,
+    _tier_name_to_num,
     classify_task,
     get_mcps_for_task,
     get_priority_mcps,
+    install_mcp,
     install_priority_mcps,
     load_mcp_config,
+    search_mcp_catalog,
+    suggest_and_install_mcp,
 )
 
 
@@ -15,6 +29,13 @@ def test_load_mcp_config():
     assert "mcps" in config["tier1_essential"]
 
 
+def test_load_mcp_config_without_orjson():
+    with patch("core.mcps.orjson", None):
+        config = load_mcp_config()
+    assert config == load_mcp_config()
+    assert config is not load_mcp_config()
+
+
 def test_classify_task_always_includes_tier1():
     tiers = classify_task("anything at all")
     assert "tier1_essential" in tiers
@@ -47,6 +68,44 @@ def test_classify_task_multiple_tiers():
     assert "tier2_data" in tiers
 
 
+def test_classify_task_reloads_changed_config(tmp_path):
+    config_path = tmp_path / "mcp.json"
+    config_path.write_text(
+        json.dumps({"tier2_data": {"trigger_keywords": ["table"], "mcps": {}}})
+    )
+    with patch("core.mcps.MCP_CONFIG", config_path):
+        assert "tier2_data" in classify_task("join the table")
+        config_path.write_text(
+            json.dumps({"tier2_data": {"trigger_keywords": ["sql"], "mcps": {}}})
+        )
+        # Force a new mtime even on filesystems with coarse timestamps
+        os.utime(config_path, ns=(0, 10**9))
+        assert "tier2_data" not in classify_task("join the table")
+
+
+def test_classify_task_keywords_are_case_insensitive(tmp_path):
+    config_path = tmp_path / "mcp.json"
+    config_path.write_text(
+        json.dumps({"tier7_cloud": {"trigger_keywords": ["AWS"], "mcps": {}}})
+    )
+    with patch("core.mcps.MCP_CONFIG", config_path):
+        assert classify_task("Deploy to aws") == {"tier1_essential", "tier7_cloud"}
+
+
+@pytest.mark.parametrize(
+    "tier_name, num",
+    [
+        ("tier0_orchestration", 0),
+        ("tier3_ml", 3),
+        ("tier12", 12),
+        ("tier_misc", 1),
+        ("custom", 1),
+    ],
+)
+def test_tier_name_to_num(tier_name: str, num: int):
+    assert _tier_name_to_num(tier_name) == num
+
+
 def test_get_mcps_for_task_includes_essentials():
     mcps = get_mcps_for_task("simple task")
     assert "git" in mcps
@@ -61,7 +120,28 @@ def test_get_mcps_for_task_ml():
 
 # --- Bridge-integrated tests ---
 
-from unittest.mock import MagicMock, patch
+
+def test_get_mcps_for_task_shares_lazy_loader(tmp_path):
+    config_path = tmp_path / "mcp.json"
+    config = {
+        "tier1_essential": {"mcps": {"fs": {}}},
+        "tier3_ml": {"trigger_keywords": ["model"], "mcps": {"hf": {"x": 1}}},
+    }
+    config_path.write_text(json.dumps(config))
+    with patch("core.mcps.MCP_CONFIG", config_path):
+        assert get_mcps_for_task("train a model") == {"fs": {}, "hf": {"x": 1}}
+        lazy = _lazy_loader()
+        assert lazy.get_active_mcps() == ["hf"]
+        assert get_mcps_for_task("plot results") == {"fs": {}}
+        assert _lazy_loader() is lazy
+
+        config["tier3_ml"]["mcps"] = {"torch": {}}
+        config_path.write_text(json.dumps(config))
+        os.utime(config_path, ns=(0, 10**9))
+        assert get_mcps_for_task("a model") == {"fs": {}, "torch": {}}
+        assert _lazy_loader() is not lazy
+        assert _lazy_loader().get_active_mcps() == ["torch"]
+
 
 from core.mcps import get_claude_flow_mcp_config
 
@@ -126,6 +206,15 @@ def test_install_priority_mcps_returns_dict():
     assert isinstance(results, dict)
     # sequential-thinking should be present
     assert "sequential-thinking" in results
+    mock_install.assert_any_call(
+        "sequential-thinking", "@modelcontextprotocol/server-sequential-thinking"
+    )
+
+
+def test_npx_package_skips_flags():
+    assert _npx_package(["-y", "--quiet", "pkg", "extra"]) == "pkg"
+    assert _npx_package(["-y"]) is None
+    assert _npx_package([]) is None
 
 
 def test_get_claude_flow_mcp_config_unavailable():
@@ -134,3 +223,96 @@ def test_get_claude_flow_mcp_config_unavailable():
     with patch("core.mcps._get_bridge", side_effect=ClaudeFlowUnavailable("no")):
         config = get_claude_flow_mcp_config()
         assert config == {}
+
+
+def test_search_mcp_catalog_prompt_reuses_catalog_section(tmp_path):
+    curated = tmp_path / "MCP_CATALOG.md"
+    raggable = tmp_path / "raggable_mcps.md"
+    curated.write_text("- pubmed-mcp")
+    raggable.write_text("- slack-mcp")
+    prompts = []
+
+    def fake_call(prompt, **kwargs):
+        prompts.append(prompt)
+        return {"name": "pubmed-mcp"}
+
+    with (
+        patch("core.mcps.MCP_CATALOG", curated),
+        patch("core.mcps.RAGGABLE_CATALOG", raggable),
+        patch("core.claude_helper.call_claude_json", side_effect=fake_call),
+    ):
+        assert search_mcp_catalog("papers")["name"] == "pubmed-mcp"
+        search_mcp_catalog("chat")
+        section = _catalog_section()
+        assert section is _catalog_section()
+
+        raggable.write_text("- discord-mcp")
+        os.utime(raggable, ns=(0, 0))
+        search_mcp_catalog("chat")
+
+    assert section == "--- CATALOG ---\n- pubmed-mcp\n\n- slack-mcp"
+    assert prompts[0].endswith("null}\n\n" + section)
+    assert '"papers"' in prompts[0] and '"chat"' in prompts[1]
+    assert prompts[2].endswith("- pubmed-mcp\n\n- discord-mcp")
+
+
+def test_search_mcp_catalog_without_catalogs(tmp_path):
+    with (
+        patch("core.mcps.MCP_CATALOG", tmp_path / "missing.md"),
+        patch("core.mcps.RAGGABLE_CATALOG", tmp_path / "missing_too.md"),
+    ):
+        assert _catalog_section() is None
+        assert search_mcp_catalog("anything") is None
+
+
+def test_install_mcp_skips_recent_successful_install(tmp_path):
+    failed = subprocess.CalledProcessError(1, "npm")
+    with (
+        patch("core.mcps.INSTALL_MARKER_DIR", tmp_path / "markers"),
+        patch("core.mcps.subprocess.run", side_effect=[failed, None, None]) as run,
+    ):
+        assert install_mcp("fetch", "mcp-fetch") is False
+        assert install_mcp("fetch", "mcp-fetch") is True
+        assert install_mcp("fetch", "mcp-fetch") is True
+        assert run.call_count == 2
+
+        marker = next((tmp_path / "markers").iterdir())
+        os.utime(marker, (0, 0))
+        assert install_mcp("fetch", "mcp-fetch") is True
+        assert run.call_count == 3
+
+        # Forced or different sources always run the installer
+        run.side_effect = None
+        install_mcp("fetch", "mcp-fetch", force=True)
+        install_mcp("fetch", "owner/mcp-fetch")
+    assert run.call_count == 5
+    assert run.call_args.args[0].startswith("npx -y @anthropic-ai/mcp-installer")
+
+
+MATCH = {"name": "pubmed-mcp", "install_cmd": "npx -y pubmed-mcp"}
+
+
+def test_suggest_and_install_mcp_headless_skips_search():
+    with patch("core.mcps.search_mcp_catalog") as search:
+        assert suggest_and_install_mcp("papers") is False
+    search.assert_not_called()
+
+
+def test_suggest_and_install_mcp_installs_only_with_consent():
+    printed = []
+    run = MagicMock()
+    with patch("core.mcps.search_mcp_catalog", return_value=MATCH):
+        # Without a prompt the match is shown but not installed
+        assert not suggest_and_install_mcp(
+            "papers", print_fn=printed.append, run_cmd=run
+        )
+        assert not suggest_and_install_mcp(
+            "papers", prompt_fn=lambda q, d: "no", run_cmd=run
+        )
+        run.assert_not_called()
+        assert suggest_and_install_mcp(
+            "papers", prompt_fn=lambda q, d: "yes", run_cmd=run
+        )
+        assert suggest_and_install_mcp("papers", auto_install=True, run_cmd=run)
+    assert "Found MCP: pubmed-mcp" in printed
+    assert run.call_count == 2